@@ -0,0 +1,13 @@
+-- Add a half-precision copy of article embeddings for the first-stage similarity scan
+-- The clustering service pulls the top candidates by embedding_f16 and re-ranks them by the full-precision embedding
+-- Requires pgvector >= 0.7 (halfvec type)
+
+ALTER TABLE articles ADD COLUMN IF NOT EXISTS embedding_f16 halfvec(768);
+
+-- Backfill existing rows (new rows are written by the application)
+UPDATE articles SET embedding_f16 = embedding::halfvec(768) WHERE embedding_f16 IS NULL AND embedding IS NOT NULL;
+
+-- HNSW index over the half-precision column
+CREATE INDEX IF NOT EXISTS idx_articles_embedding_f16 ON articles USING hnsw (embedding_f16 halfvec_cosine_ops);
+
+COMMENT ON COLUMN articles.embedding_f16 IS 'Half-precision copy of embedding for candidate retrieval (requires pgvector >= 0.7)';
@@ -0,0 +1,14 @@
+-- Add a lowercased copy of article tags so custom-tag matching can use a GIN index
+-- The smart article service matches with array overlap (tags_lower && ARRAY[...]) instead of parsing tags JSON per row
+
+ALTER TABLE articles ADD COLUMN IF NOT EXISTS tags_lower TEXT[];
+
+-- Backfill existing rows (new rows are written by the application)
+UPDATE articles
+SET tags_lower = ARRAY(SELECT lower(tag) FROM jsonb_array_elements_text(tags::jsonb) AS tag)
+WHERE tags_lower IS NULL AND tags IS NOT NULL;
+
+-- GIN index for array overlap lookups
+CREATE INDEX IF NOT EXISTS idx_articles_tags_lower ON articles USING gin (tags_lower);
+
+COMMENT ON COLUMN articles.tags_lower IS 'Lowercased tags array for indexed custom-tag matching';
@@ -17,9 +17,11 @@ CREATE TABLE IF NOT EXISTS articles (
     category VARCHAR(100),
     subcategory VARCHAR(100),
     tags TEXT[],
+    tags_lower TEXT[], -- Lowercased tags, GIN-indexed for custom-tag matching
     source_name VARCHAR(200),
     author VARCHAR(200),
     embedding vector(768), -- For semantic similarity search
+    embedding_f16 halfvec(768), -- Half-precision copy used for the first-stage similarity scan
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -45,6 +47,7 @@ CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category);
 CREATE INDEX IF NOT EXISTS idx_articles_subcategory ON articles(subcategory);
 CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url);
 CREATE INDEX IF NOT EXISTS idx_articles_created_at ON articles(created_at);
+CREATE INDEX IF NOT EXISTS idx_articles_tags_lower ON articles USING gin (tags_lower);
 
 CREATE INDEX IF NOT EXISTS idx_story_clusters_importance ON story_clusters(importance_score);
 CREATE INDEX IF NOT EXISTS idx_story_clusters_category ON story_clusters(category);
@@ -53,6 +56,7 @@ CREATE INDEX IF NOT EXISTS idx_story_clusters_last_updated ON story_clusters(las
 
 -- Vector similarity index for semantic search
 CREATE INDEX IF NOT EXISTS idx_articles_embedding ON articles USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+CREATE INDEX IF NOT EXISTS idx_articles_embedding_f16 ON articles USING hnsw (embedding_f16 halfvec_cosine_ops);
 
 -- Foreign key constraint
 ALTER TABLE articles 
@@ -96,4 +100,6 @@ CREATE TRIGGER update_story_clusters_updated_at
 COMMENT ON TABLE articles IS 'Individual news articles with vector embeddings for semantic search';
 COMMENT ON TABLE story_clusters IS 'Grouped related articles with importance scoring';
 COMMENT ON COLUMN articles.embedding IS '768-dimensional vector for semantic similarity search';
+COMMENT ON COLUMN articles.embedding_f16 IS 'Half-precision copy of embedding for candidate retrieval (requires pgvector >= 0.7)';
+COMMENT ON COLUMN articles.tags_lower IS 'Lowercased tags array for indexed custom-tag matching';
 COMMENT ON COLUMN story_clusters.importance_score IS 'Article importance score from 1-100 based on multiple factors';
\ No newline at end of file
@@ -68,7 +68,9 @@ CREATE TABLE articles (
     category VARCHAR(100),
     subcategory VARCHAR(100),
     tags TEXT, -- JSON string of tags array
+    tags_lower TEXT[], -- Lowercased tags, GIN-indexed for custom-tag matching
     embedding vector(768), -- For semantic similarity search
+    embedding_f16 halfvec(768), -- Half-precision copy used for the first-stage similarity scan
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
@@ -103,6 +105,7 @@ CREATE INDEX idx_articles_subcategory ON articles(subcategory);
 CREATE INDEX idx_articles_url ON articles(url);
 CREATE INDEX idx_articles_created_at ON articles(created_at);
 CREATE INDEX idx_articles_uniqueness_hash ON articles(uniqueness_hash);
+CREATE INDEX idx_articles_tags_lower ON articles USING gin (tags_lower);
 
 CREATE INDEX idx_story_clusters_importance ON story_clusters(importance_score);
 CREATE INDEX idx_story_clusters_category ON story_clusters(category);
@@ -111,6 +114,7 @@ CREATE INDEX idx_story_clusters_last_updated ON story_clusters(last_updated_at);
 
 -- Vector similarity index for semantic search
 CREATE INDEX idx_articles_embedding ON articles USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+CREATE INDEX idx_articles_embedding_f16 ON articles USING hnsw (embedding_f16 halfvec_cosine_ops);
 
 -- Update updated_at trigger for episodes
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -192,4 +196,6 @@ COMMENT ON TABLE story_clusters IS 'Grouped related articles with importance sco
 COMMENT ON COLUMN episodes.subcategories IS 'JSON array of subcategory strings';
 COMMENT ON COLUMN episodes.status IS 'Current generation status of the episode';
 COMMENT ON COLUMN articles.embedding IS '768-dimensional vector for semantic similarity search';
+COMMENT ON COLUMN articles.embedding_f16 IS 'Half-precision copy of embedding for candidate retrieval (requires pgvector >= 0.7)';
+COMMENT ON COLUMN articles.tags_lower IS 'Lowercased tags array for indexed custom-tag matching';
 COMMENT ON COLUMN story_clusters.importance_score IS 'Article importance score from 1-100 based on multiple factors';
\ No newline at end of file
@@ -23,7 +23,8 @@ Agent 4 (ScriptWriterAgent):
 """
 
 import logging
-import json
+from collections import defaultdict
+import orjson
 from typing import List, Dict, Any, AsyncGenerator
 from google.adk.agents import LlmAgent, SequentialAgent, BaseAgent
 from google.adk.events import Event, EventActions
@@ -95,7 +96,7 @@ Return ONLY valid JSON:
         elif response_text.startswith("```"):
             response_text = response_text.split("```")[1].split("```")[0].strip()
 
-        metadata = json.loads(response_text)
+        metadata = orjson.loads(response_text)
 
         # Save to session state
         ctx.session.state["metadata"] = metadata
@@ -348,13 +349,13 @@ class PodcastGenerationWorkflow:
 
     def __init__(self, llm_service):
         self.llm_service = llm_service
+        # Subcategory -> topic lookup; subcategories not listed are their own topic
+        self._topic_map = {subcategory: "World News" for subcategory in self.WORLD_NEWS_SUBCATEGORIES}
         logger.info("✅ Initialized real Google ADK multi-agent workflow")
 
     def _normalize_topic_name(self, subcategory: str) -> str:
         """Map world news subcategories to 'World News', keep others as-is"""
-        if subcategory in self.WORLD_NEWS_SUBCATEGORIES:
-            return "World News"
-        return subcategory
+        return self._topic_map.get(subcategory, subcategory)
 
     async def generate_podcast(self, sources: List[Dict[str, Any]], duration_minutes: int, user_name: str = None):
         """
@@ -372,13 +373,10 @@ class PodcastGenerationWorkflow:
         logger.info(f"   Duration: {duration_minutes} minutes")
 
         # Group sources by normalized subcategory (world news regions → "World News")
-        topics_map = {}
+        topics_map = defaultdict(list)
         for source in sources:
             subcategory = source.get('subcategory', 'General')
-            topic_name = self._normalize_topic_name(subcategory)
-            if topic_name not in topics_map:
-                topics_map[topic_name] = []
-            topics_map[topic_name].append(source)
+            topics_map[self._topic_map.get(subcategory, subcategory)].append(source)
 
         # Sort topics by category so similar topics are grouped together
         # (e.g., all sports together, all tech together)
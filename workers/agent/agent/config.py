@@ -54,6 +54,9 @@ class Settings:
     google_cloud_location = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
     google_credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "")
     tts_provider = os.getenv("TTS_PROVIDER", "deepinfra")
+    llm_concurrency = int(os.getenv("AGENT_LLM_CONCURRENCY", "8"))
+    auto_join_threshold = float(os.getenv("AGENT_AUTO_JOIN_THRESHOLD", "0.95"))
+    auto_join_sample_rate = float(os.getenv("AGENT_AUTO_JOIN_SAMPLE_RATE", "0.01"))
     
     # RSS feeds for fallback - now using categorized feeds
     @property
@@ -6,19 +6,111 @@ Provides centralized configuration for the worker service using the shared confi
 
 import sys
 import os
-from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 # Add shared config to Python path
-shared_path = Path(__file__).parent.parent.parent.parent / "shared"
-if str(shared_path) not in sys.path:
-    sys.path.append(str(shared_path))
+_here = os.path.dirname(os.path.abspath(__file__))
+shared_path = sys.intern(os.path.normpath(os.path.join(_here, "..", "..", "..", "shared")))
+if shared_path not in sys.path:
+    sys.path.append(shared_path)
 
 from yourcast_config import ConfigManager, get_config
 
 
 class WorkerConfig:
     """Worker-specific configuration wrapper with convenience methods."""
+
+    # Config-backed settings, assigned from _KEY_TABLE in __init__ (declared here for type checkers)
+    # Database and Redis
+    database_url: str
+    redis_url: str
+    # TTS Configuration
+    tts_deepinfra_url: str
+    tts_deepinfra_voices: List[str]
+    tts_deepinfra_speed: float
+    tts_deepinfra_sample_rate: int
+    tts_deepinfra_timeout: int
+    tts_google_url: str
+    tts_google_timeout: int
+    # LLM Configuration
+    llm_words_per_minute: int
+    llm_intro_text: str
+    llm_target_style: str
+    llm_max_sources: int
+    llm_min_summarize_chars: int
+    # Embedding Configuration
+    embedding_max_length: int
+    embedding_batch_size: int
+    # Algorithm Configuration
+    min_importance_score: int
+    max_importance_score: int
+    default_importance_score: int
+    min_articles_per_episode: int
+    max_articles_per_episode: int
+    # Worker Limits
+    redis_queue_timeout: int
+    redis_sleep_interval: int
+    max_concurrent_jobs: int
+    job_timeout: int
+    retry_attempts: int
+    article_max_bytes: int
+    # Database Query Limits
+    db_similar_articles_limit: int
+    db_recent_clusters_limit: int
+    db_default_limit: int
+    # RSS Discovery
+    rss_recent_hours: int
+    rss_max_articles_per_feed: int
+    rss_feed_timeout: int
+    # Storage settings
+    storage_base_url: str
+    
+    # Attribute name -> (dotted config key, default); resolved once in __init__
+    _KEY_TABLE: Dict[str, Tuple[str, Any]] = {
+        # Database and Redis
+        "database_url": ("internal.postgres_url", None),
+        "redis_url": ("internal.redis_url", None),
+        # TTS Configuration
+        "tts_deepinfra_url": ("external_services.deepinfra.url", None),
+        "tts_deepinfra_voices": ("tts.deepinfra.voices", None),
+        "tts_deepinfra_speed": ("tts.deepinfra.speed", 1.0),
+        "tts_deepinfra_sample_rate": ("tts.deepinfra.sample_rate", 24000),
+        "tts_deepinfra_timeout": ("tts.deepinfra.timeout", 60),
+        "tts_google_url": ("external_services.google_tts.url", None),
+        "tts_google_timeout": ("tts.google.timeout", 30),
+        # LLM Configuration
+        "llm_words_per_minute": ("llm.podcast.words_per_minute", 120),
+        "llm_intro_text": ("llm.podcast.intro_text", "Welcome to Your Cast, your world update, without the noise."),
+        "llm_target_style": ("llm.podcast.target_style", "professional and conversational - like a knowledgeable friend sharing interesting news. Let the facts and details carry the interest naturally. Avoid over-the-top enthusiasm, forced humor, or overusing phrases like 'buckle up', 'you heard that right', etc."),
+        "llm_max_sources": ("llm.podcast.max_sources", 10),
+        "llm_min_summarize_chars": ("llm.podcast.min_summarize_chars", 1500),
+        # Embedding Configuration
+        "embedding_max_length": ("embedding.text_max_length", 8192),
+        "embedding_batch_size": ("embedding.batch_size", 100),
+        # Algorithm Configuration
+        "min_importance_score": ("algorithms.clustering.min_importance_score", 40),
+        "max_importance_score": ("algorithms.clustering.max_importance_score", 100),
+        "default_importance_score": ("algorithms.clustering.default_importance_score", 50),
+        "min_articles_per_episode": ("algorithms.article_selection.min_articles_per_episode", 3),
+        "max_articles_per_episode": ("algorithms.article_selection.max_articles_per_episode", 15),
+        # Worker Limits
+        "redis_queue_timeout": ("limits.redis.queue_timeout", 5),
+        "redis_sleep_interval": ("limits.redis.sleep_interval", 5),
+        "max_concurrent_jobs": ("limits.worker.max_concurrent_jobs", 3),
+        "job_timeout": ("limits.worker.job_timeout", 600),
+        "retry_attempts": ("limits.worker.retry_attempts", 3),
+        "article_max_bytes": ("limits.worker.article_max_bytes", 5 * 1024 * 1024),
+        # Database Query Limits
+        "db_similar_articles_limit": ("limits.database.query_limits.similar_articles", 5),
+        "db_recent_clusters_limit": ("limits.database.query_limits.recent_clusters", 20),
+        "db_default_limit": ("limits.database.query_limits.default", 10),
+        # RSS Discovery
+        "rss_recent_hours": ("algorithms.rss_discovery.recent_hours", 24),
+        "rss_max_articles_per_feed": ("algorithms.rss_discovery.max_articles_per_feed", 50),
+        "rss_feed_timeout": ("algorithms.rss_discovery.feed_timeout", 10),
+        # Storage settings
+        "storage_base_url": ("api.storage_base_url", None),
+    }
     
     def __init__(self):
         self.config = get_config()
@@ -35,148 +127,19 @@ class WorkerConfig:
             self.config.validate_required_keys(required_keys)
         except KeyError as e:
             raise RuntimeError(f"Missing required worker configuration: {e}")
-    
-    # Database and Redis
-    @property
-    def database_url(self) -> str:
-        return self.config.get("internal.postgres_url")
-    
-    @property
-    def redis_url(self) -> str:
-        return self.config.get("internal.redis_url")
-    
-    # TTS Configuration
-    @property
-    def tts_deepinfra_url(self) -> str:
-        return self.config.get("external_services.deepinfra.url")
-    
-    @property
-    def tts_deepinfra_voices(self) -> List[str]:
-        return self.config.get("tts.deepinfra.voices")
-    
-    @property
-    def tts_deepinfra_speed(self) -> float:
-        return self.config.get("tts.deepinfra.speed", 1.0)
-    
-    @property
-    def tts_deepinfra_sample_rate(self) -> int:
-        return self.config.get("tts.deepinfra.sample_rate", 24000)
-    
-    @property
-    def tts_deepinfra_timeout(self) -> int:
-        return self.config.get("tts.deepinfra.timeout", 60)
-    
-    @property
-    def tts_google_url(self) -> str:
-        return self.config.get("external_services.google_tts.url")
-    
-    @property
-    def tts_google_timeout(self) -> int:
-        return self.config.get("tts.google.timeout", 30)
-    
-    # LLM Configuration
-    @property
-    def llm_words_per_minute(self) -> int:
-        return self.config.get("llm.podcast.words_per_minute", 120)
-    
-    @property
-    def llm_intro_text(self) -> str:
-        return self.config.get("llm.podcast.intro_text", "Welcome to Your Cast, your world update, without the noise.")
-    
-    @property
-    def llm_target_style(self) -> str:
-        return self.config.get("llm.podcast.target_style", "professional and conversational - like a knowledgeable friend sharing interesting news. Let the facts and details carry the interest naturally. Avoid over-the-top enthusiasm, forced humor, or overusing phrases like 'buckle up', 'you heard that right', etc.")
-    
-    @property
-    def llm_max_sources(self) -> int:
-        return self.config.get("llm.podcast.max_sources", 10)
-    
-    # Embedding Configuration
-    @property
-    def embedding_max_length(self) -> int:
-        return self.config.get("embedding.text_max_length", 8192)
-    
-    @property
-    def embedding_batch_size(self) -> int:
-        return self.config.get("embedding.batch_size", 100)
-    
-    # Algorithm Configuration
-    @property
-    def min_importance_score(self) -> int:
-        return self.config.get("algorithms.clustering.min_importance_score", 40)
-    
-    @property
-    def max_importance_score(self) -> int:
-        return self.config.get("algorithms.clustering.max_importance_score", 100)
-    
-    @property
-    def default_importance_score(self) -> int:
-        return self.config.get("algorithms.clustering.default_importance_score", 50)
-    
-    @property
-    def min_articles_per_episode(self) -> int:
-        return self.config.get("algorithms.article_selection.min_articles_per_episode", 3)
-    
-    @property
-    def max_articles_per_episode(self) -> int:
-        return self.config.get("algorithms.article_selection.max_articles_per_episode", 15)
-    
-    # Worker Limits
-    @property
-    def redis_queue_timeout(self) -> int:
-        return self.config.get("limits.redis.queue_timeout", 5)
-    
-    @property
-    def redis_sleep_interval(self) -> int:
-        return self.config.get("limits.redis.sleep_interval", 5)
-    
-    @property
-    def max_concurrent_jobs(self) -> int:
-        return self.config.get("limits.worker.max_concurrent_jobs", 3)
-    
-    @property
-    def job_timeout(self) -> int:
-        return self.config.get("limits.worker.job_timeout", 600)
-    
-    @property
-    def retry_attempts(self) -> int:
-        return self.config.get("limits.worker.retry_attempts", 3)
-    
-    # Database Query Limits
-    @property
-    def db_similar_articles_limit(self) -> int:
-        return self.config.get("limits.database.query_limits.similar_articles", 5)
-    
-    @property
-    def db_recent_clusters_limit(self) -> int:
-        return self.config.get("limits.database.query_limits.recent_clusters", 20)
-    
-    @property
-    def db_default_limit(self) -> int:
-        return self.config.get("limits.database.query_limits.default", 10)
-    
-    # RSS Discovery
-    @property
-    def rss_recent_hours(self) -> int:
-        return self.config.get("algorithms.rss_discovery.recent_hours", 24)
-    
-    @property
-    def rss_max_articles_per_feed(self) -> int:
-        return self.config.get("algorithms.rss_discovery.max_articles_per_feed", 50)
-    
-    @property
-    def rss_feed_timeout(self) -> int:
-        return self.config.get("algorithms.rss_discovery.feed_timeout", 10)
+        
+        # Resolve every config-backed setting once as a plain instance attribute
+        try:
+            for name, (key, default) in self._KEY_TABLE.items():
+                setattr(self, name, self.config.get(key, default))
+        except KeyError as e:
+            raise RuntimeError(f"Missing worker configuration: {e}")
     
     # Storage settings
     @property
     def storage_dir(self) -> str:
         return os.getenv("STORAGE_DIR", "/app/storage")
     
-    @property
-    def storage_base_url(self) -> str:
-        return self.config.get("api.storage_base_url")
-    
     # API Keys (still from environment variables for security)
     @property
     def gemini_api_key(self) -> str:
@@ -1,9 +1,12 @@
+import asyncio
 import logging
 import uuid
+from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import List, Dict, Any
 from agent.services.smart_article_service import SmartArticleService
 from agent.services.article_content_service import ArticleContentService
-from agent.services.llm_service import LLMService
+from agent.services.llm_service import LLMService, get_llm_service
 from agent.services.tts_service import TTSService
 from agent.services.transcript_service import TranscriptService
 from agent.services.storage_service import StorageService
@@ -12,18 +15,44 @@ from agent.adk_agents import create_podcast_generation_workflow
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=4)
+def _get_adk_workflow(llm_service: LLMService):
+    """Share one ADK workflow per LLMService instance (services hash by identity)"""
+    return create_podcast_generation_workflow(llm_service)
+
+
+@dataclass(slots=True)
+class Source:
+    """Article converted to the source format expected by the LLM service"""
+    id: str
+    title: str
+    url: str
+    published_date: str
+    excerpt: str
+    full_text: str
+    source_name: str
+    summary: str
+    category: str
+    subcategory: str
+    importance_score: int
+    story_title: str
+    cluster_id: str
+    tags: list
+
+
 class PodcastGenerator:
     def __init__(self, episode_service: EpisodeService):
         self.episode_service = episode_service
         self.smart_article_service = SmartArticleService()
         self.article_content_service = ArticleContentService()
-        self.llm_service = LLMService()
+        self.llm_service = get_llm_service()
         self.tts_service = TTSService()
         self.transcript_service = TranscriptService()
         self.storage_service = StorageService()
 
         # Initialize ADK multi-agent workflow
-        self.adk_workflow = create_podcast_generation_workflow(self.llm_service)
+        self.adk_workflow = _get_adk_workflow(self.llm_service)
         logger.info("🤖 Initialized with Google ADK multi-agent workflow")
     
     async def generate_episode(self, episode_id: str, subcategories: List[str], duration_minutes: int, custom_tags: List[str] = None):
@@ -31,7 +60,7 @@ class PodcastGenerator:
         try:
             # Get episode details including user_id for storage organization
             episode = self.episode_service.get_episode(episode_id)
-            user_id = episode.user_id if episode and hasattr(episode, 'user_id') else None
+            user_id = getattr(episode, 'user_id', None) if episode else None
             logger.info(f"Generating episode {episode_id} for user: {user_id or 'anonymous'}")
 
             # Stage 1: Discover articles
@@ -60,7 +89,8 @@ class PodcastGenerator:
             self.episode_service.set_episode_status(
                 episode_id, "extracting_content", stage="extracting_content", progress=20
             )
-            sources = self._convert_articles_to_sources(articles, fetch_full_content=True)
+            # Downstream services consume plain dicts, so serialize once here
+            sources = [asdict(source) for source in self._convert_articles_to_sources(articles, fetch_full_content=True)]
             article_to_source_map = self.episode_service.store_sources(episode_id, sources)
             
             # Stage 3: Generate script using ADK multi-agent workflow
@@ -68,7 +98,7 @@ class PodcastGenerator:
                 episode_id, "generating_script", stage="generating_script", progress=40
             )
             # Get user name for personalization
-            user_name = episode.name if episode and hasattr(episode, 'name') else None
+            user_name = getattr(episode, 'name', None) if episode else None
 
             # Use ADK workflow which coordinates 4 specialized agents
             logger.info("🤖 Invoking ADK multi-agent workflow for podcast generation...")
@@ -98,9 +128,12 @@ class PodcastGenerator:
             self.episode_service.set_episode_status(
                 episode_id, "uploading_files", stage="uploading_files", progress=90
             )
-            audio_url = self.storage_service.upload_audio(episode_id, combined_audio_path, user_id=user_id)
-            transcript_url = self.storage_service.upload_transcript(episode_id, transcript_data)
-            vtt_url = self.storage_service.upload_vtt(episode_id, vtt_content)
+            # The three writes are independent, so run them concurrently
+            audio_url, transcript_url, vtt_url = await asyncio.gather(
+                asyncio.to_thread(self.storage_service.upload_audio, episode_id, combined_audio_path, user_id=user_id),
+                asyncio.to_thread(self.storage_service.upload_transcript, episode_id, transcript_data),
+                asyncio.to_thread(self.storage_service.upload_vtt, episode_id, vtt_content),
+            )
             
             # Stage 7: Update episode with final data
             self.episode_service.set_episode_status(
@@ -141,7 +174,7 @@ class PodcastGenerator:
             )
             raise
     
-    def _convert_articles_to_sources(self, articles: List[Dict[str, Any]], fetch_full_content: bool = False) -> List[Dict[str, Any]]:
+    def _convert_articles_to_sources(self, articles: List[Dict[str, Any]], fetch_full_content: bool = False) -> List[Source]:
         """
         Convert smart article service format to sources format expected by LLM service
         With cluster fallback: if article content fetch fails, try other articles from same cluster
@@ -160,12 +193,12 @@ class PodcastGenerator:
 
             # Try to fetch full content with cluster fallback
             if fetch_full_content and url:
-                logger.info(f"Fetching article content from: {article.get('title', 'Unknown')[:60]}...")
+                logger.info("Fetching article content from: %s...", article.get('title', 'Unknown')[:60])
                 full_text = self.article_content_service.fetch_article_content(url)
 
                 # If failed and we have a cluster, try backups from same cluster
                 if not full_text and cluster_id:
-                    logger.warning(f"Failed to fetch {article.get('source_name', 'Unknown')}, trying backups from cluster {cluster_id}")
+                    logger.warning("Failed to fetch %s, trying backups from cluster %s", article.get('source_name', 'Unknown'), cluster_id)
                     backups = self.smart_article_service.get_cluster_backups(
                         cluster_id=cluster_id,
                         exclude_article_ids=[article_id],
@@ -176,46 +209,50 @@ class PodcastGenerator:
                     for i, backup in enumerate(backups, 1):
                         backup_url = backup.get("url", "")
                         if backup_url:
-                            logger.info(f"  Trying backup {i}/{len(backups)}: {backup.get('source_name', 'Unknown')}")
+                            logger.info("  Trying backup %d/%d: %s", i, len(backups), backup.get('source_name', 'Unknown'))
                             full_text = self.article_content_service.fetch_article_content(backup_url)
                             if full_text:
                                 # Use the backup article instead
-                                logger.info(f"  ✓ Success! Using {backup.get('source_name', 'Unknown')} instead")
+                                logger.info("  ✓ Success! Using %s instead", backup.get('source_name', 'Unknown'))
                                 article = backup  # Replace with backup article
                                 url = backup_url
                                 break
 
                     if not full_text:
-                        logger.warning(f"  All {len(backups)} backups failed for cluster {cluster_id}, using RSS summary")
+                        logger.warning("  All %d backups failed for cluster %s, using RSS summary", len(backups), cluster_id)
+
+            # excerpt/summary are persisted with the episode sources, so they are
+            # needed even when full_text was fetched; bind the lookup once
+            summary = article.get("summary") or ""
 
             # Determine what to use as full_text
             if full_text:
-                logger.info(f"Using fetched content ({len(full_text)} chars) for: {article.get('title', 'Unknown')[:50]}")
+                logger.info("Using fetched content (%d chars) for: %s", len(full_text), article.get('title', 'Unknown')[:50])
             else:
                 # Fallback to RSS summary
-                full_text = article.get("summary", "")
+                full_text = summary
                 if fetch_full_content:
-                    logger.warning(f"Using RSS summary for: {article.get('title', 'Unknown')[:50]}")
+                    logger.warning("Using RSS summary for: %s", article.get('title', 'Unknown')[:50])
 
             # Create source in the format expected by LLM service
-            source = {
-                "id": article.get("article_id", str(uuid.uuid4())),
-                "title": article.get("title", ""),
-                "url": url,
-                "published_date": article.get("publication_timestamp", ""),
-                "excerpt": article.get("summary", "")[:200] + "..." if len(article.get("summary", "")) > 200 else article.get("summary", ""),
-                "full_text": full_text,  # Full article content or RSS summary
-                "source_name": article.get("source_name", "Unknown"),
-                "summary": article.get("summary", ""),  # Keep original RSS summary
+            source = Source(
+                id=article.get("article_id") or str(uuid.uuid4()),
+                title=article.get("title", ""),
+                url=url,
+                published_date=article.get("publication_timestamp", ""),
+                excerpt=summary[:200] + "..." if len(summary) > 200 else summary,
+                full_text=full_text,  # Full article content or RSS summary
+                source_name=article.get("source_name", "Unknown"),
+                summary=summary,  # Keep original RSS summary
                 # Additional metadata from our smart system
-                "category": article.get("category", ""),
-                "subcategory": article.get("subcategory", ""),
-                "importance_score": article.get("importance_score", 50),
-                "story_title": article.get("story_title", ""),
-                "cluster_id": article.get("cluster_id", ""),
-                "tags": article.get("tags", [])
-            }
+                category=article.get("category", ""),
+                subcategory=article.get("subcategory", ""),
+                importance_score=article.get("importance_score", 50),
+                story_title=article.get("story_title", ""),
+                cluster_id=article.get("cluster_id", ""),
+                tags=article.get("tags", [])
+            )
             sources.append(source)
 
-        logger.info(f"Converted {len(sources)} articles to sources format")
+        logger.info("Converted %d articles to sources format", len(sources))
         return sources
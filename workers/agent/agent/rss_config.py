@@ -8,7 +8,8 @@ article classification and clustering accuracy.
 # UPDATED: Testing live mount at 2025-08-20 16:09
 """
 
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
 
 # RSS Feed Configuration organized by categories
 # Define the desired category order
@@ -363,26 +364,44 @@ RSS_FEEDS_CONFIG = {
     }
 }
 
+@dataclass(frozen=True, slots=True)
+class FeedGroup:
+    """Immutable view of one RSS_FEEDS_CONFIG category"""
+    category: str
+    subcategories: Tuple[str, ...]
+    feeds: Tuple[str, ...]
+
+# Compact, immutable form of RSS_FEEDS_CONFIG used by the helpers below
+# (RSS_FEEDS_CONFIG itself stays a dict for existing callers)
+_FEED_GROUPS: Tuple[FeedGroup, ...] = tuple(
+    FeedGroup(category, tuple(category_data["subcategories"]), tuple(category_data["feeds"]))
+    for category, category_data in RSS_FEEDS_CONFIG.items()
+)
+
+# Lookup indexes built once at import so per-feed lookups are O(1)
+# (setdefault keeps the first category listing a feed, matching the old linear scan)
+_FEED_TO_CATEGORY: Dict[str, str] = {}
+for _group in _FEED_GROUPS:
+    for _feed_url in _group.feeds:
+        _FEED_TO_CATEGORY.setdefault(_feed_url, _group.category)
+
+_CATEGORY_SUBCATS: Dict[str, Tuple[str, ...]] = {group.category: group.subcategories for group in _FEED_GROUPS}
+
+_ALL_FEEDS: Tuple[str, ...] = tuple(feed_url for group in _FEED_GROUPS for feed_url in group.feeds)
+_CATEGORIES: Tuple[str, ...] = tuple(group.category for group in _FEED_GROUPS)
+
 def get_all_feeds() -> List[str]:
     """Get all RSS feed URLs as a flat list"""
-    all_feeds = []
-    for category_data in RSS_FEEDS_CONFIG.values():
-        all_feeds.extend(category_data["feeds"])
-    return all_feeds
+    return list(_ALL_FEEDS)
 
 def get_feed_category(feed_url: str) -> str:
     """Get the category for a specific feed URL"""
-    for category, category_data in RSS_FEEDS_CONFIG.items():
-        if feed_url in category_data["feeds"]:
-            return category
-    return "General"
+    return _FEED_TO_CATEGORY.get(feed_url, "General")
 
 def get_category_subcategories(category: str) -> List[str]:
     """Get subcategories for a specific category"""
-    if category in RSS_FEEDS_CONFIG:
-        return RSS_FEEDS_CONFIG[category]["subcategories"]
-    return []
+    return list(_CATEGORY_SUBCATS.get(category, ()))
 
 def get_categories() -> List[str]:
     """Get all available categories"""
-    return list(RSS_FEEDS_CONFIG.keys())
+    return list(_CATEGORIES)
@@ -1,22 +1,207 @@
 """
 Article Content Fetcher Service - Extracts full article content from URLs
-Uses requests for fetching with timeout, trafilatura for extraction
+Uses requests for fetching with timeout, resiliparse for extraction (trafilatura as fallback)
+Batches of URLs are fetched concurrently over a shared HTTP/2 httpx client
+Single fetches go through an on-disk HTTP cache that honors ETag/Last-Modified
 """
+import asyncio
+import hashlib
 import logging
+import os
+import tempfile
+import threading
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 import trafilatura
-from typing import Optional
+from trafilatura.settings import use_config
+from cachetools import TTLCache
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from courlan import normalize_url
+from requests_cache import CachedSession
+from resiliparse.extract.html2text import extract_plain_text
+from resiliparse.parse.encoding import detect_encoding
+from resiliparse.parse.html import HTMLTree
+from typing import AsyncIterator, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from agent.config_manager import get_worker_config
 
 logger = logging.getLogger(__name__)
 
+CHUNK_SIZE = 64 * 1024  # Read response bodies in 64 KiB chunks
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Ask for compressed HTML; urllib3 only lists br/zstd when brotli/zstandard are
+# importable, so we never advertise an encoding we cannot decode
+REQUEST_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+
+EXTRACT_QUEUE_SIZE = 32  # Downloaded pages waiting for extraction in batch fetches
+
+MIN_ARTICLE_CHARS = 100  # Shorter extractions are treated as failures
+
+# Syndicated stories often arrive as identical HTML from several feeds, so
+# extraction results are memoized by a hash of the page (small pages are not worth it)
+EXTRACT_CACHE_SIZE = 4096
+EXTRACT_CACHE_MIN_BYTES = 8 * 1024
+
+# Hosts that keep timing out, refusing connections or returning 5xx are skipped for a while
+# instead of burning the full request timeout on every URL that points at them (4xx is per-URL)
+BAD_HOST_FAILURE_THRESHOLD = 3
+BAD_HOST_TTL_SECONDS = 300
+
+_bad_hosts: "TTLCache[str, int]" = TTLCache(maxsize=1024, ttl=BAD_HOST_TTL_SECONDS)
+_bad_hosts_lock = threading.Lock()
+
+
+def _is_bad_host(host: str) -> bool:
+    """Whether a host has failed often enough recently to be skipped"""
+    with _bad_hosts_lock:
+        return _bad_hosts.get(host, 0) >= BAD_HOST_FAILURE_THRESHOLD
+
+
+def _record_host_failure(host: str) -> None:
+    """Count a failed request against a host"""
+    with _bad_hosts_lock:
+        _bad_hosts[host] = _bad_hosts.get(host, 0) + 1
+
+
+# trafilatura settings are built once per process instead of on every extract() call
+_TRAFILATURA_CONFIG = use_config()
+_TRAFILATURA_CONFIG.set("DEFAULT", "MIN_EXTRACTED_SIZE", str(MIN_ARTICLE_CHARS))
+
+_extract_cache: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+_extract_cache_lock = threading.Lock()
+
+
+def _extract_html(html: Union[str, bytes], url: Optional[str] = None) -> Optional[str]:
+    """Extract main content with resiliparse, falling back to trafilatura on short output"""
+    if isinstance(html, bytes):
+        tree = HTMLTree.parse_from_bytes(html, detect_encoding(html))
+    else:
+        tree = HTMLTree.parse(html)
+
+    extracted_text = extract_plain_text(tree, main_content=True, alt_texts=False, links=False)
+    if extracted_text and len(extracted_text.strip()) >= MIN_ARTICLE_CHARS:
+        return extracted_text
+
+    # include_comments=False removes comment sections
+    # include_tables=True keeps data tables
+    # include_links=False removes navigation links
+    return trafilatura.extract(
+        html,
+        url=url,
+        config=_TRAFILATURA_CONFIG,
+        include_comments=False,
+        include_tables=True,
+        include_links=False,
+        output_format='txt'
+    )
+
+
+def _extract_cache_key(html: Union[str, bytes]) -> Optional[bytes]:
+    """Digest used to memoize extraction, or None when the page is too small to bother"""
+    if len(html) < EXTRACT_CACHE_MIN_BYTES:
+        return None
+    data = html.encode() if isinstance(html, str) else html
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _extract_cache_get(key: Optional[bytes]) -> Tuple[bool, Optional[str]]:
+    """Return (hit, extracted_text) for a cache key"""
+    if key is None:
+        return False, None
+    with _extract_cache_lock:
+        if key in _extract_cache:
+            _extract_cache.move_to_end(key)
+            return True, _extract_cache[key]
+    return False, None
+
+
+def _extract_cache_put(key: Optional[bytes], extracted_text: Optional[str]) -> None:
+    """Store an extraction result, evicting the least recently used entry"""
+    if key is None:
+        return
+    with _extract_cache_lock:
+        _extract_cache[key] = extracted_text
+        if len(_extract_cache) > EXTRACT_CACHE_SIZE:
+            _extract_cache.popitem(last=False)
+
+
+def _extract_html_cached(html: Union[str, bytes], url: Optional[str] = None) -> Optional[str]:
+    """Extract article text, reusing the result for byte-identical pages"""
+    key = _extract_cache_key(html)
+    hit, extracted_text = _extract_cache_get(key)
+    if not hit:
+        extracted_text = _extract_html(html, url)
+        _extract_cache_put(key, extracted_text)
+    return extracted_text
+
+
+# Extraction is CPU-bound and holds the GIL, so batch fetches hand it to a
+# process pool shared by every service instance (created on first use)
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+_extraction_pool_lock = threading.Lock()
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    """Get the shared extraction process pool"""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            _extraction_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return _extraction_pool
+
+
+def _canonical_url(url: str) -> str:
+    """Normalize a URL for de-duplication (drops tracking params and fragments, sorts the query)"""
+    try:
+        return normalize_url(url, strict=True)
+    except ValueError:
+        return url
+
+
 class ArticleContentService:
-    def __init__(self):
-        self.timeout_seconds = 15  # 15 second timeout for requests
+    def __init__(self) -> None:
+        self.timeout_seconds: int = 15  # 15 second timeout for requests
+        self.max_concurrency: int = 64  # Max in-flight fetches for batch requests
+        self.max_bytes: int = get_worker_config().article_max_bytes  # Abort downloads above this size
+        self._pool: ProcessPoolExecutor = _get_extraction_pool()
+        self._client: Optional[httpx.AsyncClient] = None  # Created on first batch fetch
+
+        # Re-runs revalidate with conditional GETs instead of re-downloading unchanged pages
+        cache_path = os.getenv("ARTICLE_CACHE_PATH", os.path.join(tempfile.gettempdir(), "article_cache"))
+        self.session: CachedSession = CachedSession(
+            cache_path,
+            backend="sqlite",
+            expire_after=3600,
+            cache_control=True,
+            stale_if_error=True,
+            # Decided from headers before the body is read, so binary or oversized
+            # responses are never downloaded just to be written to the cache
+            filter_fn=self._is_cacheable_response
+        )
+        # Keep-alive pool shared by every fetch so same-host requests reuse TCP/TLS,
+        # with a couple of quick retries on transient gateway errors
+        self.session.headers.update(REQUEST_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def fetch_article_content(self, url: str) -> Optional[str]:
         """
         Fetch and extract the main article content from a URL
-        Uses requests with 15-second timeout, then trafilatura for extraction
+        Uses requests with 15-second timeout, then extracts the main content
 
         Args:
             url: Article URL to fetch
@@ -24,53 +209,239 @@ class ArticleContentService:
         Returns:
             Extracted article text, or None if extraction failed
         """
+        host = urlsplit(url).netloc
+        if _is_bad_host(host):
+            logger.warning("Skipping %s: host %s has been failing repeatedly", url, host)
+            return None
+
         try:
-            logger.info(f"Fetching article content from: {url}")
+            logger.info("Fetching article content from: %s", url)
 
-            # Download the webpage using requests with timeout
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            response = requests.get(url, timeout=self.timeout_seconds, headers=headers)
-            response.raise_for_status()  # Raise exception for bad status codes
+            # Download the webpage using the shared session with timeout
+            # Stream the raw bytes; the HTML parser sniffs the charset from
+            # the BOM/<meta> itself, so there is no need to decode to str first
+            with self.session.get(url, timeout=self.timeout_seconds, stream=True) as response:
+                response.raise_for_status()  # Raise exception for bad status codes
+                if not self._is_acceptable_response(response.headers, url):
+                    return None
 
-            html = response.text
-            if not html:
-                logger.warning(f"Empty response from {url}")
-                return None
-
-            # Extract the main article content using trafilatura
-            # include_comments=False removes comment sections
-            # include_tables=True keeps data tables
-            # include_links=False removes navigation links
-            extracted_text = trafilatura.extract(
-                html,
-                include_comments=False,
-                include_tables=True,
-                include_links=False,
-                output_format='txt'
-            )
+                html = bytearray()
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    html.extend(chunk)
+                    if len(html) > self.max_bytes:
+                        logger.warning("Response from %s exceeded %s bytes, aborting", url, self.max_bytes)
+                        return None
 
-            if not extracted_text or len(extracted_text.strip()) < 100:
-                logger.warning(f"Extracted text too short or empty from {url}")
+            if not html:
+                logger.warning("Empty response from %s", url)
                 return None
 
-            logger.info(f"Successfully extracted {len(extracted_text)} characters from {url}")
-            return extracted_text.strip()
+            return self._extract_text(bytes(html), url)
 
         except requests.Timeout:
-            logger.warning(f"Timeout ({self.timeout_seconds}s) fetching article from {url}")
+            logger.warning("Timeout (%ss) fetching article from %s", self.timeout_seconds, url)
+            _record_host_failure(host)
+            return None
+        except requests.HTTPError as e:
+            logger.warning("Request failed for %s: %s", url, e)
+            # A 4xx is about this URL (e.g. a stale link), not the host
+            if e.response is not None and e.response.status_code >= 500:
+                _record_host_failure(host)
+            return None
+        except requests.ConnectionError as e:
+            logger.warning("Request failed for %s: %s", url, e)
+            _record_host_failure(host)
             return None
         except requests.RequestException as e:
-            logger.warning(f"Request failed for {url}: {str(e)}")
+            logger.warning("Request failed for %s: %s", url, e)
             return None
         except Exception as e:
-            logger.error(f"Error extracting article content from {url}: {str(e)}")
+            logger.error("Error extracting article content from %s: %s", url, e)
             return None
 
-    def fetch_multiple_articles(self, urls: list[str]) -> dict[str, Optional[str]]:
+    def _is_cacheable_response(self, response: requests.Response) -> bool:
         """
-        Fetch content from multiple article URLs
+        Cache only HTML with a declared size within the limit
+
+        Responses without a Content-Length are not cached: requests-cache reads the whole
+        body to store it, which would bypass the streaming size limit below.
+        """
+        content_type = response.headers.get("content-type", "").lower()
+        if content_type and not (content_type.startswith("text/") or "html" in content_type):
+            return False
+        content_length = response.headers.get("content-length", "")
+        return content_length.isdigit() and int(content_length) <= self.max_bytes
+
+    def _is_acceptable_response(self, headers: Mapping[str, str], url: str) -> bool:
+        """Check response headers so binary or oversized pages are skipped before the body is read"""
+        content_type = headers.get("content-type", "").lower()
+        if content_type and not (content_type.startswith("text/") or "html" in content_type):
+            logger.warning("Skipping non-HTML response (%s) from %s", content_type, url)
+            return False
+
+        content_length = headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            logger.warning("Skipping %s-byte response from %s (limit %s)", content_length, url, self.max_bytes)
+            return False
+
+        return True
+
+    def _extract_text(self, html: bytes, url: str) -> Optional[str]:
+        """Extract the main article text from downloaded HTML"""
+        return self._validate_extracted_text(_extract_html_cached(html, url), url)
+
+    async def _extract_text_async(self, html: bytes, url: str) -> Optional[str]:
+        """Extract the main article text in the process pool without blocking the event loop"""
+        key = _extract_cache_key(html)
+        hit, extracted_text = _extract_cache_get(key)
+        if not hit:
+            loop = asyncio.get_running_loop()
+            extracted_text = await loop.run_in_executor(self._pool, _extract_html, html, url)
+            _extract_cache_put(key, extracted_text)
+        return self._validate_extracted_text(extracted_text, url)
+
+    def _validate_extracted_text(self, extracted_text: Optional[str], url: str) -> Optional[str]:
+        """Reject extractions that are too short to be an article"""
+        if not extracted_text or len(extracted_text.strip()) < MIN_ARTICLE_CHARS:
+            logger.warning("Extracted text too short or empty from %s", url)
+            return None
+
+        logger.info("Successfully extracted %d characters from %s", len(extracted_text), url)
+        return extracted_text.strip()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the persistent async client, multiplexing same-host requests over HTTP/2"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=float(self.timeout_seconds),
+                headers=REQUEST_HEADERS,
+                follow_redirects=True
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _download(self, semaphore: asyncio.Semaphore, url: str) -> Optional[bytes]:
+        """Download a single article page on the shared async client"""
+        host = urlsplit(url).netloc
+        if _is_bad_host(host):
+            logger.warning("Skipping %s: host %s has been failing repeatedly", url, host)
+            return None
+
+        async with semaphore:
+            try:
+                logger.info("Fetching article content from: %s", url)
+
+                async with self._get_client().stream("GET", url) as response:
+                    response.raise_for_status()
+                    if not self._is_acceptable_response(response.headers, url):
+                        return None
+
+                    html = bytearray()
+                    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                        html.extend(chunk)
+                        if len(html) > self.max_bytes:
+                            logger.warning("Response from %s exceeded %s bytes, aborting", url, self.max_bytes)
+                            return None
+
+                if not html:
+                    logger.warning("Empty response from %s", url)
+                    return None
+
+                return bytes(html)
+
+            except httpx.TimeoutException:
+                logger.warning("Timeout (%ss) fetching article from %s", self.timeout_seconds, url)
+                _record_host_failure(host)
+                return None
+            except httpx.HTTPStatusError as e:
+                logger.warning("Request failed for %s: %s", url, e)
+                # A 4xx is about this URL (e.g. a stale link), not the host
+                if e.response.status_code >= 500:
+                    _record_host_failure(host)
+                return None
+            except httpx.TransportError as e:
+                logger.warning("Request failed for %s: %s", url, e)
+                _record_host_failure(host)
+                return None
+            except httpx.HTTPError as e:
+                logger.warning("Request failed for %s: %s", url, e)
+                return None
+            except Exception as e:
+                logger.error("Error fetching article content from %s: %s", url, e)
+                return None
+
+    async def iter_articles_async(self, urls: list[str]) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """
+        Fetch multiple article URLs concurrently, yielding each result as soon as it is ready
+        One persistent client is shared by all URLs so connections and TLS are reused.
+        Downloads and extraction run as separate stages joined by a bounded queue,
+        so the network keeps working while pages are parsed in the process pool.
+
+        Args:
+            urls: List of article URLs
+
+        Yields:
+            (url, extracted content or None if failed) in completion order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Bounded so fast downloads back off instead of buffering every page in memory
+        fetch_queue: "asyncio.Queue[Optional[Tuple[str, bytes]]]" = asyncio.Queue(maxsize=EXTRACT_QUEUE_SIZE)
+        result_queue: "asyncio.Queue[Optional[Tuple[str, Optional[str]]]]" = asyncio.Queue()
+
+        async def produce(url: str) -> None:
+            html = await self._download(semaphore, url)
+            if html is None:
+                await result_queue.put((url, None))
+            else:
+                await fetch_queue.put((url, html))
+
+        async def consume() -> None:
+            while True:
+                item = await fetch_queue.get()
+                if item is None:
+                    return
+                url, html = item
+                try:
+                    content = await self._extract_text_async(html, url)
+                except Exception as e:
+                    logger.error("Error extracting article content from %s: %s", url, e)
+                    content = None
+                await result_queue.put((url, content))
+
+        async def run_stages() -> None:
+            consumers = [asyncio.create_task(consume()) for _ in range(os.cpu_count() or 1)]
+            try:
+                await asyncio.gather(*[produce(url) for url in urls], return_exceptions=True)
+            finally:
+                # One sentinel per consumer stops the extraction stage once the queue drains
+                for _ in consumers:
+                    await fetch_queue.put(None)
+                await asyncio.gather(*consumers, return_exceptions=True)
+                await result_queue.put(None)
+
+        stages = asyncio.create_task(run_stages())
+        try:
+            while True:
+                item = await result_queue.get()
+                if item is None:
+                    break
+                yield item
+        finally:
+            if not stages.done():
+                stages.cancel()
+            await asyncio.gather(stages, return_exceptions=True)
+
+    async def fetch_multiple_articles_async(self, urls: list[str]) -> dict[str, Optional[str]]:
+        """
+        Fetch content from multiple article URLs concurrently
+        Callers that can process results incrementally should use iter_articles_async
 
         Args:
             urls: List of article URLs
@@ -78,12 +449,40 @@ class ArticleContentService:
         Returns:
             Dictionary mapping URL to extracted content (or None if failed)
         """
-        results = {}
-        for url in urls:
-            content = self.fetch_article_content(url)
-            results[url] = content
+        # Syndicated stories often show up under several URLs that differ only by
+        # tracking parameters or fragments, so fetch each canonical URL once
+        canonical_urls = {url: _canonical_url(url) for url in urls}
+        representatives: dict[str, str] = {}
+        for url, canonical in canonical_urls.items():
+            representatives.setdefault(canonical, url)
+
+        fetched: dict[str, Optional[str]] = {}
+        async for url, content in self.iter_articles_async(list(representatives.values())):
+            fetched[url] = content
+
+        results = {url: fetched.get(representatives[canonical_urls[url]]) for url in urls}
 
         success_count = sum(1 for content in results.values() if content is not None)
-        logger.info(f"Successfully fetched {success_count}/{len(urls)} articles")
+        logger.info("Successfully fetched %s/%d articles", success_count, len(urls))
 
         return results
+
+    def fetch_multiple_articles(self, urls: list[str]) -> dict[str, Optional[str]]:
+        """
+        Fetch content from multiple article URLs
+        Synchronous wrapper around fetch_multiple_articles_async
+
+        Args:
+            urls: List of article URLs
+
+        Returns:
+            Dictionary mapping URL to extracted content (or None if failed)
+        """
+        async def run() -> dict[str, Optional[str]]:
+            # The client is bound to this event loop, so close it before the loop ends
+            try:
+                return await self.fetch_multiple_articles_async(urls)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
@@ -1,17 +1,33 @@
 import logging
 import hashlib
-import uuid
-import json
+import ahocorasick
+import httpx
+import orjson
+import random
+import re
+import threading
+from collections import OrderedDict
 import numpy as np
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Set, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import event, text
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from google.genai import errors as genai_errors
+from pgvector.psycopg2 import register_vector
+from pybloom_live import ScalableBloomFilter
 
 from agent.config import settings
 from agent.services.embedding_service import EmbeddingService
-from agent.services.llm_service import LLMService
-from agent.rss_config import get_feed_category, get_category_subcategories
+from agent.services.llm_service import get_llm_service
+from agent.services.similarity_cache import QueryCache, embedding_key
+from agent.utils.uuid_utils import generate_uuidv7
+from agent.utils.vector_utils import batched_cosine
+from agent.rss_config import RSS_FEEDS_CONFIG, get_feed_category, get_category_subcategories
 
 # Import models (we'll need to update the import path based on your structure)
 # from app.models.article import Article
@@ -19,281 +35,59 @@ from agent.rss_config import get_feed_category, get_category_subcategories
 
 logger = logging.getLogger(__name__)
 
-class ClusteringService:
-    def __init__(self, db_session: Session, debug_llm_responses: bool = False):
-        """Initialize the clustering service"""
-        self.db = db_session
-        self.embedding_service = EmbeddingService()
-        self.llm_service = LLMService()
-        self.similarity_threshold = 0.85
-        self.debug_llm_responses = debug_llm_responses
-        
-    def process_article(self, article_data: Dict[str, Any]) -> Optional[str]:
-        """
-        Process a single article through the clustering pipeline
-        
-        Args:
-            article_data: Dictionary containing article metadata
-            
-        Returns:
-            Article ID if successful, None if failed or duplicate
-        """
-        try:
-            # Step 1: Calculate uniqueness hash
-            uniqueness_hash = self._calculate_hash(article_data['url'])
-            
-            # Step 2: Check for duplicates
-            if self._is_duplicate(uniqueness_hash):
-                logger.info(f"Skipping duplicate article: {article_data['title']}")
-                return None
-            
-            # Step 3: Generate embedding
-            embedding_text = f"{article_data['title']} {article_data.get('summary', '')}"
-            embedding = self.embedding_service.generate_embedding(embedding_text)
-            
-            if embedding is None:
-                logger.error(f"Failed to generate embedding for: {article_data['title']}")
-                return None
-            
-            # Step 4: Find similar articles and clusters
-            similar_articles, cluster_candidates = self._find_similar_articles(embedding)
-            
-            # Step 5: Use AI judge to determine clustering
-            cluster_decision = self._ai_judge_clustering(article_data, similar_articles)
-            
-            # Step 6: Process clustering decision
-            if cluster_decision['action'] == 'create_new':
-                cluster_id = self._create_new_cluster(article_data, cluster_decision)
-            else:
-                cluster_id = cluster_decision['cluster_id']
-            
-            # Step 7: Save article to database
-            article_id = self._save_article(
-                article_data, 
-                uniqueness_hash, 
-                embedding, 
-                cluster_id,
-                cluster_decision
-            )
-            
-            logger.info(f"Successfully processed article: {article_data['title']} -> {cluster_id}")
-            return article_id
-            
-        except Exception as e:
-            logger.error(f"Failed to process article {article_data.get('title', 'Unknown')}: {str(e)}")
-            # Rollback any failed transaction to reset connection state
-            try:
-                self.db.rollback()
-            except:
-                pass
-            return None
-    
-    def process_articles_batch(self, articles_data: List[Dict[str, Any]]) -> List[Optional[str]]:
-        """Process multiple articles in a batch"""
-        results = []
-        for article_data in articles_data:
-            result = self.process_article(article_data)
-            results.append(result)
-        return results
-    
-    def _calculate_hash(self, url: str) -> str:
-        """Calculate MD5 hash of URL for duplicate detection"""
-        return hashlib.md5(url.encode()).hexdigest()
-    
-    def _is_duplicate(self, uniqueness_hash: str) -> bool:
-        """Check if article hash already exists in database"""
-        # TODO: Replace with actual database query
-        # query = self.db.query(Article).filter(Article.uniqueness_hash == uniqueness_hash).first()
-        # return query is not None
-        
-        # Placeholder implementation
-        result = self.db.execute(
-            text("SELECT 1 FROM articles WHERE uniqueness_hash = :hash LIMIT 1"),
-            {"hash": uniqueness_hash}
-        ).fetchone()
-        return result is not None
-    
-    def _find_similar_articles(self, embedding: np.ndarray) -> Tuple[List[Dict], List[str]]:
-        """
-        Find articles with similar embeddings using pgvector
-        
-        Returns:
-            Tuple of (similar_articles_data, cluster_ids)
-        """
-        try:
-            # Convert numpy array to list for SQL
-            embedding_list = embedding.tolist()
-            
-            # Use pgvector's cosine similarity search
-            # This query finds articles with similarity > threshold
-            # Use CAST syntax instead of ::vector with bind parameters
-            query = text("""
-                SELECT
-                    article_id, title, summary, cluster_id, source_name, publication_timestamp,
-                    1 - (embedding <=> CAST(:embedding_param AS vector)) as similarity
-                FROM articles
-                WHERE 1 - (embedding <=> CAST(:embedding_param AS vector)) > :threshold_param
-                ORDER BY similarity DESC
-                LIMIT 10
-            """)
-            
-            results = self.db.execute(query, {
-                "embedding_param": json.dumps(embedding_list),
-                "threshold_param": self.similarity_threshold
-            }).fetchall()
-            
-            similar_articles = []
-            cluster_candidates = set()
-            
-            for row in results:
-                similar_articles.append({
-                    'article_id': row.article_id,
-                    'title': row.title,
-                    'summary': row.summary,
-                    'cluster_id': row.cluster_id,
-                    'source_name': row.source_name,
-                    'publication_timestamp': row.publication_timestamp,
-                    'similarity': row.similarity
-                })
-                cluster_candidates.add(row.cluster_id)
-            
-            return similar_articles, list(cluster_candidates)
-            
-        except Exception as e:
-            logger.error(f"Failed to find similar articles: {str(e)}")
-            try:
-                self.db.rollback()
-            except:
-                pass
-            return [], []
-    
-    def _ai_judge_clustering(self, new_article: Dict[str, Any], similar_articles: List[Dict]) -> Dict[str, Any]:
-        """
-        Use AI to determine if article should join existing cluster or create new one
-        """
-        # Use feed category if available, otherwise fall back to keyword categorization
-        feed_category = new_article.get('feed_category', self._categorize_article(new_article))
-        
-        if not similar_articles:
-            # Still call AI judge to generate subcategories and tags, even without similar articles
-            try:
-                # Use the existing clustering prompt but with empty similar_articles list
-                prompt = self._create_clustering_prompt(new_article, [])
-                response = self.llm_service.generate_text(prompt)
-                
-                # Debug: Log the LLM response if enabled
-                if self.debug_llm_responses:
-                    print(f"\n🤖 LLM Response for '{new_article['title'][:50]}...':")
-                    print(f"📝 Response: {response}")
-                    print("-" * 80)
-                
-                decision = self._parse_ai_decision(response, [])
-                
-                # Ensure it's marked as create_new
-                decision['action'] = 'create_new'
-                decision['reason'] = 'No similar articles found'
-                decision['cluster_id'] = None
-                
-                return decision
-                
-            except Exception as e:
-                logger.error(f"AI categorization failed: {str(e)}")
-                return {
-                    'action': 'create_new',
-                    'reason': 'No similar articles found, AI categorization failed',
-                    'category': feed_category,
-                    'subcategory': None,
-                    'tags': []
-                }
-        
-        try:
-            # Prepare context for AI judge
-            similar_context = []
-            for article in similar_articles[:5]:  # Limit to top 5 most similar
-                similar_context.append({
-                    'title': article['title'],
-                    'summary': article['summary'],
-                    'cluster_id': article['cluster_id'],
-                    'similarity': article['similarity']
-                })
-            
-            # Create prompt for AI judge
-            prompt = self._create_clustering_prompt(new_article, similar_context)
-            
-            # Get AI decision
-            response = self.llm_service.generate_text(prompt)
-            
-            # Debug: Log the LLM response if enabled
-            if self.debug_llm_responses:
-                print(f"\n🤖 LLM Response for '{new_article['title'][:50]}...':")
-                print(f"📝 Response: {response}")
-                print("-" * 80)
-            
-            decision = self._parse_ai_decision(response, similar_articles)
-            
-            return decision
-            
-        except Exception as e:
-            logger.error(f"AI judge failed, creating new cluster: {str(e)}")
-            return {
-                'action': 'create_new',
-                'reason': 'AI judge error',
-                'category': self._categorize_article(new_article),
-                'subcategory': None,
-                'tags': []
-            }
-    
-    def _create_clustering_prompt(self, new_article: Dict[str, Any], similar_articles: List[Dict]) -> str:
-        """Create prompt for AI clustering decision"""
+# Subcategory lookups for the clustering prompt and parser, built once at import
+_ALL_SUBCATS = sorted({s for d in RSS_FEEDS_CONFIG.values() for s in d.get('subcategories', [])})
+_SUBCATS_STR = ', '.join(_ALL_SUBCATS)
+_SUBCAT_TO_CAT: Dict[str, str] = {}
+for _category, _data in RSS_FEEDS_CONFIG.items():
+    for _subcategory in _data.get('subcategories', []):
+        _SUBCAT_TO_CAT.setdefault(_subcategory, _category)  # First listing wins, as in the old linear scan
 
-        # Build flat list of ALL subcategories across all categories
-        from agent.rss_config import RSS_FEEDS_CONFIG
-        all_subcategories = []
-        for category, data in RSS_FEEDS_CONFIG.items():
-            all_subcategories.extend(data.get('subcategories', []))
+# Keyword fallback for _categorize_article, in priority order
+_CATEGORY_KEYWORDS = (
+    ('Technology', ('tech', 'ai', 'apple', 'google', 'microsoft')),
+    ('Politics', ('election', 'president', 'congress', 'politics')),
+    ('Business', ('stock', 'market', 'economy', 'business')),
+    ('Health', ('health', 'medical', 'covid', 'vaccine')),
+)
 
-        subcategories_str = ', '.join(sorted(all_subcategories))
+_CATEGORY_AUTOMATON = ahocorasick.Automaton()
+for _priority, (_category, _keywords) in enumerate(_CATEGORY_KEYWORDS):
+    for _keyword in _keywords:
+        _CATEGORY_AUTOMATON.add_word(_keyword, _priority)
+_CATEGORY_AUTOMATON.make_automaton()
 
-        # Format publication date for new article
-        from datetime import timezone
-        new_pub_date = new_article.get('publication_timestamp')
-        new_pub_str = new_pub_date.strftime('%Y-%m-%d %H:%M UTC') if new_pub_date else 'Unknown'
+# Half-precision (embedding_f16) candidates re-ranked at full precision per similarity lookup
+HALFVEC_CANDIDATES = 40
+
+# Number of similar articles shown to the AI judge, and the title tokenizer used to pick them
+LLM_CONTEXT_SIZE = 3
+_TOKEN_RE = re.compile(r"\w+")
 
-        prompt = f"""You are a news editor determining if articles belong to the same story.
+# Leading integer of an importance_score like "8 (high importance)"
+_IMPORTANCE_RE = re.compile(r'(\d+)')
+
+# AI judge prompt templates; similar-article blocks are joined between header and footer
+PROMPT_HEADER_FMT = """You are a news editor determining if articles belong to the same story.
 
 NEW ARTICLE:
-Title: {new_article['title']}
-Summary: {new_article.get('summary', 'No summary')}
-Source: {new_article['source_name']}
-Publication Date: {new_pub_str}
+Title: {title}
+Summary: {summary}
+Source: {source_name}
+Publication Date: {pub_str}
 
 SIMILAR EXISTING ARTICLES:
 """
 
-        for i, article in enumerate(similar_articles, 1):
-            # Calculate age relative to new article
-            article_pub_date = article.get('publication_timestamp')
-            if article_pub_date and new_pub_date:
-                age_hours = (new_pub_date - article_pub_date).total_seconds() / 3600
-                age_str = f"{age_hours:.1f} hours ago"
-                pub_str = article_pub_date.strftime('%Y-%m-%d %H:%M UTC')
-            else:
-                age_str = "Unknown"
-                pub_str = "Unknown"
-
-            prompt += f"""
-{i}. Title: {article['title']}
-   Summary: {article['summary']}
+SIM_BLOCK_FMT = """
+{i}. Title: {title}
+   Summary: {summary}
    Publication Date: {pub_str} ({age_str})
-   Cluster ID: {article['cluster_id']}
-   Similarity: {article['similarity']:.3f}
+   Cluster ID: {cluster_id}
+   Similarity: {similarity:.3f}
 """
 
-        # Get feed category hint for few-shot examples only
-        feed_category = new_article.get('feed_category', self._categorize_article(new_article))
-        examples = self._get_few_shot_examples(feed_category)
-        
-        prompt += f"""
+PROMPT_FOOTER_FMT = """
 INSTRUCTIONS:
 1. Determine if the new article is about the same story as any existing article
 2. Consider: same event, same people/companies, same timeframe, same core topic
@@ -355,13 +149,10 @@ Respond with JSON only:
 }}
 
 NOTE: Do NOT include a "category" field - it will be automatically derived from your subcategory choice."""
-        
-        return prompt
-    
-    def _get_few_shot_examples(self, category: str) -> str:
-        """Get few-shot examples based on category"""
-        examples = {
-            "Technology": """
+
+# Few-shot examples for the clustering prompt, keyed by feed category
+_EXAMPLES: Dict[str, str] = {
+    "Technology": """
 Example 1 - CREATE NEW CLUSTER:
 Article: "Apple Announces New MacBook Pro with M3 Chip"
 Summary: "Apple unveiled its latest MacBook Pro featuring the new M3 processor with improved performance and battery life"
@@ -419,7 +210,7 @@ Decision:
     "importance_score": 74.0
 }""",
 
-            "Sports": """
+    "Sports": """
 Example 1 - CREATE NEW CLUSTER:
 Article: "Tiger Woods Wins Masters Tournament by 2 Strokes"
 Summary: "Tiger Woods captured his sixth Masters title with a final round 68 at Augusta National"
@@ -478,7 +269,7 @@ Decision:
     "importance_score": 89.0
 }""",
 
-            "Business": """
+    "Business": """
 Example 1 - CREATE NEW CLUSTER:
 Article: "Tesla Reports Record Q3 Earnings Beat Expectations"
 Summary: "Tesla posted quarterly revenue of $25.2B, beating analyst estimates by 8%"
@@ -517,7 +308,7 @@ Decision:
     "importance_score": 60.3
 }""",
 
-            "Politics & Government": """
+    "Politics & Government": """
 Example 1 - CREATE NEW CLUSTER:
 Article: "Senate Passes Bipartisan Infrastructure Bill 69-30"
 Summary: "The $1.2 trillion infrastructure package received broad bipartisan support in final Senate vote"
@@ -555,9 +346,9 @@ Decision:
     "emotion_score": 44,
     "importance_score": 57.8
 }"""
-        }
-        
-        return examples.get(category, """
+}
+
+_DEFAULT_EXAMPLE = """
 Example - CREATE NEW CLUSTER:
 Article: "[Title of article about current topic]"
 Summary: "[Brief summary of the article content]"
@@ -594,123 +385,940 @@ Decision:
     "magnitude_score": 50,
     "emotion_score": 50,
     "importance_score": 50.0
-}""")
-    
-    def _parse_ai_decision(self, response: str, similar_articles: List[Dict]) -> Dict[str, Any]:
-        """Parse AI response into clustering decision"""
-        try:
-            # Try to extract JSON from response
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.endswith("```"):
-                response = response[:-3]
-            
-            decision = json.loads(response)
-            
-            # Validate decision
-            if decision['action'] not in ['join_existing', 'create_new']:
-                raise ValueError("Invalid action")
-            
-            if decision['action'] == 'join_existing' and not decision.get('cluster_id'):
-                # Find the most similar cluster
-                if similar_articles:
-                    decision['cluster_id'] = similar_articles[0]['cluster_id']
-                else:
-                    decision['action'] = 'create_new'
-
-            # Automatically derive category from subcategory
-            subcategory = decision.get('subcategory')
-            if subcategory:
-                from agent.rss_config import RSS_FEEDS_CONFIG
-                category_found = None
-
-                # Search for which category contains this subcategory
-                for cat_name, cat_data in RSS_FEEDS_CONFIG.items():
-                    if subcategory in cat_data.get('subcategories', []):
-                        category_found = cat_name
-                        break
-
-                if category_found:
-                    decision['category'] = category_found
-                    logger.info(f"Mapped subcategory '{subcategory}' → category '{category_found}'")
-                else:
-                    # Subcategory not found in any category - log warning and default to General
-                    logger.warning(f"Subcategory '{subcategory}' not found in RSS_FEEDS_CONFIG. Defaulting to 'General'")
-                    decision['category'] = 'General'
-            else:
-                # No subcategory provided - default both
-                logger.warning("No subcategory in AI response. Defaulting to General/None")
-                decision['category'] = 'General'
-                decision['subcategory'] = None
+}"""
 
-            # Parse importance_score if it's a string
-            if 'importance_score' in decision:
-                importance_str = str(decision['importance_score'])
-                # Extract first digit if it's a string like "8 (high importance)"
-                import re
-                match = re.search(r'(\d+)', importance_str)
-                if match:
-                    decision['importance_score'] = int(match.group(1))
-                else:
-                    decision['importance_score'] = 50  # Default
+# Bloom filters of stored article URLs, shared across service instances and keyed by database URL.
+# Keyed on URL rather than uniqueness_hash so rows stored under the old MD5 hashes are covered too.
+# Rows written by other processes after loading are caught by the unique constraints on insert.
+_seen_urls_by_db: Dict[str, ScalableBloomFilter] = {}
+_seen_urls_lock = threading.Lock()
 
-            return decision
-            
-        except Exception as e:
-            logger.warning(f"Failed to parse AI decision: {str(e)}")
-            return {
-                'action': 'create_new',
-                'reason': 'Failed to parse AI response',
-                'category': 'General',
-                'subcategory': None,
-                'tags': []
-            }
-    
-    def _categorize_article(self, article_data: Dict[str, Any]) -> str:
-        """Simple categorization fallback"""
-        title_lower = article_data['title'].lower()
+# Uniqueness hashes recently confirmed as stored; feeds re-list the same items on every poll,
+# so most duplicates are answered here without the SQL confirmation the bloom filter needs
+RECENT_HASHES_MAX = 50000
+_recent_hashes: "OrderedDict[str, None]" = OrderedDict()
+_recent_hashes_lock = threading.Lock()
+
+# Shared across service instances; wire-service duplicates often produce near-identical embeddings
+_similarity_cache = QueryCache(max_size=2000, ttl_seconds=300)
+
+INSERT_CLUSTER_HEAD_SQL = """
+    INSERT INTO story_clusters (cluster_id, canonical_title, importance_score, created_at)
+    VALUES """
+CLUSTER_ROW_SQL = "(:cluster_id, :canonical_title, :importance_score, :created_at)"
+INSERT_CLUSTER_SQL = text(INSERT_CLUSTER_HEAD_SQL + CLUSTER_ROW_SQL)
+
+INSERT_ARTICLE_HEAD_SQL = """
+    INSERT INTO articles (
+        article_id, cluster_id, url, uniqueness_hash, source_name,
+        title, summary, publication_timestamp, category, subcategory,
+        tags, tags_lower, embedding, embedding_f16, created_at
+    ) VALUES """
+ARTICLE_ROW_SQL = """(
+        :article_id, :cluster_id, :url, :uniqueness_hash, :source_name,
+        :title, :summary, :publication_timestamp, :category, :subcategory,
+        :tags, :tags_lower, :embedding, CAST(:embedding AS halfvec(768)), :created_at
+    )"""
+INSERT_ARTICLE_SQL = text(INSERT_ARTICLE_HEAD_SQL + ARTICLE_ROW_SQL)
+
+# Failures a batch stage can hit that per-article processing may survive: database errors,
+# embedding/LLM API and transport errors, and generate_embeddings rejecting a batch (empty
+# text or a short response). Anything else is a bug and propagates.
+BATCH_STAGE_ERRORS = (SQLAlchemyError, genai_errors.APIError, httpx.TransportError, ValueError)
+
+ARTICLE_EXISTS_SQL = text("SELECT 1 FROM articles WHERE uniqueness_hash = :hash OR url = :url LIMIT 1")
+EXISTING_ARTICLES_SQL = text(
+    "SELECT uniqueness_hash, url FROM articles WHERE uniqueness_hash = ANY(:hashes) OR url = ANY(:urls)"
+)
+STORED_URLS_SQL = text("SELECT url FROM articles").execution_options(yield_per=10000)
+
+# Candidates come from the half-precision column (half the bytes per comparison)
+# and are re-ranked at full precision; only similarity > threshold is kept
+SIMILAR_ARTICLES_SQL = text("""
+    SELECT
+        article_id, title, summary, cluster_id, source_name, publication_timestamp,
+        category, subcategory, tags,
+        1 - (embedding <=> :embedding_param) as similarity
+    FROM (
+        SELECT
+            article_id, title, summary, cluster_id, source_name, publication_timestamp,
+            category, subcategory, tags, embedding
+        FROM articles
+        ORDER BY embedding_f16 <=> CAST(:embedding_param AS halfvec(768))
+        LIMIT :candidates_param
+    ) candidates
+    WHERE 1 - (embedding <=> :embedding_param) > :threshold_param
+    ORDER BY similarity DESC
+    LIMIT 10
+""")
+
+_BIND_PARAM_RE = re.compile(r":(\w+)")
+
+
+@lru_cache(maxsize=64)
+def _multi_row_insert_sql(head_sql: str, row_sql: str, row_count: int) -> TextClause:
+    """Build the multi-row INSERT for a row count once, so repeat batch sizes reuse the compiled statement"""
+    value_tuples = [
+        _BIND_PARAM_RE.sub(lambda match: f":{match.group(1)}_{i}", row_sql)
+        for i in range(row_count)
+    ]
+    return text(head_sql + ", ".join(value_tuples))
+
+
+def _multi_row_insert(head_sql: str, row_sql: str, rows: List[Dict[str, Any]]) -> Tuple[TextClause, Dict[str, Any]]:
+    """Expand a single-row INSERT into one multi-row INSERT, suffixing bind names with the row index"""
+    params = {f"{name}_{i}": value for i, row in enumerate(rows) for name, value in row.items()}
+    return _multi_row_insert_sql(head_sql, row_sql, len(rows)), params
+
+
+def _strip_code_fence(response: str) -> str:
+    """Strip surrounding whitespace and a ```json ... ``` fence from an LLM response"""
+    response = response.strip()
+    if response.startswith("```json"):
+        response = response[7:]
+    if response.endswith("```"):
+        response = response[:-3]
+    return response
+
+
+def _fallback_decision() -> Dict[str, Any]:
+    """Clustering decision used when the AI response can't be parsed"""
+    return {
+        'action': 'create_new',
+        'reason': 'Failed to parse AI response',
+        'category': 'General',
+        'subcategory': None,
+        'tags': []
+    }
+
+
+def _register_vector_adapter(engine: Engine) -> None:
+    """Let psycopg2 bind numpy arrays as pgvector values on every connection of the engine"""
+    # Checkout rather than connect: the engine may be shared and already hold pooled connections
+    if not event.contains(engine, "checkout", _on_checkout_register_vector):
+        event.listen(engine, "checkout", _on_checkout_register_vector)
+
+
+def _on_checkout_register_vector(dbapi_connection, connection_record, connection_proxy) -> None:
+    if connection_record.info.get('pgvector_registered'):
+        return
+    register_vector(dbapi_connection)
+    connection_record.info['pgvector_registered'] = True
+
+
+class ClusteringService:
+    def __init__(self, db_session: Session, debug_llm_responses: bool = False):
+        """Initialize the clustering service"""
+        self.db = db_session
+        _register_vector_adapter(db_session.get_bind())
+        self.embedding_service = EmbeddingService()
+        self.llm_service = get_llm_service()
+        self.similarity_threshold = 0.85
+        self.debug_llm_responses = debug_llm_responses
+        if debug_llm_responses:
+            logger.setLevel(logging.DEBUG)
+        self.llm_concurrency = settings.llm_concurrency  # Concurrent AI judge calls per batch
+        self.auto_join_threshold = settings.auto_join_threshold  # Skip the AI judge above this similarity
+        self.auto_join_sample_rate = settings.auto_join_sample_rate  # Share still judged, for drift checks
         
-        if any(word in title_lower for word in ['tech', 'ai', 'apple', 'google', 'microsoft']):
-            return 'Technology'
-        elif any(word in title_lower for word in ['election', 'president', 'congress', 'politics']):
-            return 'Politics'
-        elif any(word in title_lower for word in ['stock', 'market', 'economy', 'business']):
-            return 'Business'
-        elif any(word in title_lower for word in ['health', 'medical', 'covid', 'vaccine']):
-            return 'Health'
-        else:
-            return 'General'
-    
-    def _create_new_cluster(self, article_data: Dict[str, Any], decision: Dict[str, Any]) -> str:
-        """Create a new story cluster"""
-        cluster_id = str(uuid.uuid4())
-        canonical_title = article_data['title']  # Use article title as canonical
+    def process_article(self, article_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Process a single article through the clustering pipeline
         
+        Args:
+            article_data: Dictionary containing article metadata
+            
+        Returns:
+            Article ID if successful, None if failed or duplicate
+        """
         try:
-            # TODO: Replace with actual model insertion
-            # new_cluster = StoryCluster(
-            #     cluster_id=cluster_id,
-            #     canonical_title=canonical_title,
-            #     created_at=datetime.now(timezone.utc)
-            # )
-            # self.db.add(new_cluster)
+            # Step 1: Calculate uniqueness hash
+            uniqueness_hash = self._calculate_hash(article_data['url'])
             
-            # Placeholder implementation
-            importance_score = decision.get('importance_score', 50)  # Default to 50 if not provided
-            self.db.execute(
-                text("""
-                    INSERT INTO story_clusters (cluster_id, canonical_title, importance_score, created_at)
-                    VALUES (:cluster_id, :canonical_title, :importance_score, :created_at)
-                """),
-                {
-                    "cluster_id": cluster_id,
-                    "canonical_title": canonical_title,
-                    "importance_score": importance_score,
-                    "created_at": datetime.now(timezone.utc)
-                }
+            # Step 2: Check for duplicates
+            if self._is_duplicate(uniqueness_hash, article_data['url']):
+                logger.info(f"Skipping duplicate article: {article_data['title']}")
+                return None
+            
+            # Step 3: Generate embedding
+            embedding_text = f"{article_data['title']} {article_data.get('summary', '')}"
+            embedding = self.embedding_service.generate_embedding(embedding_text)
+            
+            if embedding is None:
+                logger.error(f"Failed to generate embedding for: {article_data['title']}")
+                return None
+            
+            # One float32 C-contiguous buffer reused for the cache key, the query and the insert
+            # (a no-op view now that EmbeddingService already returns float32)
+            embedding = np.ascontiguousarray(embedding, dtype=np.float32)
+            
+            # Step 4: Find similar articles and clusters
+            similar_articles = self._find_similar_articles(embedding)
+            
+            # Step 5: Auto-join near-identical stories, otherwise use AI judge to determine clustering
+            cluster_decision = self._auto_join_decision(similar_articles)
+            if cluster_decision is None:
+                cluster_decision = self._ai_judge_clustering(article_data, similar_articles)
+            cluster_decision = self._check_join_target(cluster_decision, similar_articles)
+            
+            # Step 6: Process clustering decision (new cluster and article share one timestamp)
+            created_at = datetime.now(timezone.utc)
+            if cluster_decision['action'] == 'create_new':
+                cluster_id = self._create_new_cluster(article_data, cluster_decision, created_at)
+            else:
+                cluster_id = cluster_decision['cluster_id']
+            
+            # Step 7: Save article to database
+            article_id = self._save_article(
+                article_data, 
+                uniqueness_hash, 
+                embedding, 
+                cluster_id,
+                cluster_decision,
+                created_at
             )
             
+            logger.info(f"Successfully processed article: {article_data['title']} -> {cluster_id}")
+            return article_id
+            
+        except Exception as e:
+            logger.error(f"Failed to process article {article_data.get('title', 'Unknown')}: {str(e)}")
+            # Rollback any failed transaction to reset connection state
+            try:
+                self.db.rollback()
+            except:
+                pass
+            return None
+    
+    def process_articles_batch(self, articles_data: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Process multiple articles through the clustering pipeline in stages
+
+        Each stage runs once for the whole batch (one duplicate query, one embedding
+        request, concurrent AI judge calls, one INSERT per table) instead of once per
+        article. Falls back to per-article processing if a stage before the insert fails.
+
+        Args:
+            articles_data: List of article metadata dictionaries
+
+        Returns:
+            List aligned with articles_data: article ID if saved, None if failed or duplicate
+        """
+        results: List[Optional[str]] = [None] * len(articles_data)
+        if not articles_data:
+            return results
+
+        try:
+            # Stage 1: Calculate uniqueness hashes
+            hashes = [self._calculate_hash(article_data['url']) for article_data in articles_data]
+
+            # Stage 2: Drop articles already stored or repeated within this batch
+            seen_hashes = self._find_existing_hashes(hashes, [article_data['url'] for article_data in articles_data])
+            pending = []
+            for index, uniqueness_hash in enumerate(hashes):
+                if uniqueness_hash in seen_hashes:
+                    logger.info(f"Skipping duplicate article: {articles_data[index]['title']}")
+                    continue
+                seen_hashes.add(uniqueness_hash)
+                pending.append(index)
+
+            if not pending:
+                return results
+
+            pending_articles = [articles_data[index] for index in pending]
+
+            # Stage 3: Generate all embeddings in one request
+            embeddings = self.embedding_service.generate_embeddings([
+                f"{article_data['title']} {article_data.get('summary', '')}"
+                for article_data in pending_articles
+            ])
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+            # Stage 4: Find similar articles for all embeddings in one query, plus similar earlier
+            # articles of this batch (offered under the cluster_id each will get if it creates one)
+            similar_lists = self._find_similar_articles_batch(embeddings)
+            provisional_ids = [generate_uuidv7() for _ in pending_articles]
+            similar_lists = self._add_batch_candidates(pending_articles, embeddings, similar_lists, provisional_ids)
+
+            # Stage 5: Auto-join near-identical stories, run the remaining AI judge calls concurrently
+            # Batch candidates have no category or tags to copy yet, so the AI judge decides those
+            decisions = [
+                None if similar_articles and similar_articles[0]['cluster_id'] in provisional_ids
+                else self._auto_join_decision(similar_articles)
+                for similar_articles in similar_lists
+            ]
+            judge_indices = [i for i, decision in enumerate(decisions) if decision is None]
+            if judge_indices:
+                judged = self._ai_judge_clustering_batch(
+                    [pending_articles[i] for i in judge_indices],
+                    [similar_lists[i] for i in judge_indices]
+                )
+                for i, decision in zip(judge_indices, judged):
+                    decisions[i] = decision
+            decisions = [
+                self._check_join_target(decision, similar_articles)
+                for decision, similar_articles in zip(decisions, similar_lists)
+            ]
+
+            # Stage 6: Build the new cluster and article rows, stamped with one timestamp
+            created_at = datetime.now(timezone.utc)
+            new_cluster_rows: List[Optional[Dict[str, Any]]] = []
+            article_rows = []
+            # Provisional cluster_id of each batch article -> the cluster it ends up in
+            batch_clusters: Dict[str, Any] = {}
+            for index, article_data, embedding, decision, provisional_id in zip(
+                pending, pending_articles, embeddings, decisions, provisional_ids
+            ):
+                if decision['action'] == 'create_new':
+                    cluster_row = self._build_cluster_row(article_data, decision, created_at, provisional_id)
+                    cluster_id = cluster_row['cluster_id']
+                else:
+                    cluster_row = None
+                    # Joining an earlier batch article means joining whichever cluster it went to
+                    cluster_id = batch_clusters.get(str(decision['cluster_id']), decision['cluster_id'])
+                batch_clusters[provisional_id] = cluster_id
+
+                new_cluster_rows.append(cluster_row)
+                article_rows.append(
+                    self._build_article_row(article_data, hashes[index], embedding, cluster_id, decision, created_at)
+                )
+
+        except BATCH_STAGE_ERRORS:
+            # Nothing is committed before Stage 7, so per-article processing can start over
+            logger.exception("Batch clustering stage failed, falling back to per-article processing")
+            try:
+                self.db.rollback()
+            except Exception:
+                pass
+            return [self.process_article(article_data) for article_data in articles_data]
+
+        # Stage 7: Insert all new clusters and articles in one transaction
+        cluster_rows = [cluster_row for cluster_row in new_cluster_rows if cluster_row is not None]
+        try:
+            self._create_new_clusters_bulk(cluster_rows)
+            self._save_articles_bulk(article_rows)
+            self.db.commit()
+            article_ids = [article_row['article_id'] for article_row in article_rows]
+        except IntegrityError as e:
+            # Another worker stored one of these articles since the duplicate check;
+            # retry this batch's rows one at a time so only the duplicates are dropped
+            logger.info(f"Batch insert hit a unique constraint, inserting rows individually: {str(e)}")
+            self.db.rollback()
+            article_ids = self._insert_rows_individually(new_cluster_rows, article_rows)
+        except SQLAlchemyError:
+            # The decisions are already made; retry the inserts without repeating the embedding and LLM calls
+            logger.exception("Batch insert failed, inserting rows individually")
+            self.db.rollback()
+            article_ids = self._insert_rows_individually(new_cluster_rows, article_rows)
+        _similarity_cache.invalidate()
+        self._remember_urls([article_row['url'] for article_row in article_rows])
+        self._remember_hashes([
+            article_row['uniqueness_hash'] for article_row, article_id in zip(article_rows, article_ids) if article_id
+        ])
+
+        for index, article_id in zip(pending, article_ids):
+            results[index] = article_id
+
+        logger.info(f"Batch processed {sum(article_id is not None for article_id in article_ids)} new articles ({len(cluster_rows)} new clusters) "
+                    f"out of {len(articles_data)}")
+        return results
+    
+    def _calculate_hash(self, url: str) -> str:
+        """
+        Calculate BLAKE2b-128 hash of URL for duplicate detection
+
+        Same 32 hex characters as the MD5 hashes stored before, but rows hashed with
+        MD5 are not re-hashed: duplicate checks also match on the (unique) url column.
+        """
+        return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    
+    def _is_duplicate(self, uniqueness_hash: str, url: str) -> bool:
+        """Check if article hash or URL already exists in database"""
+        # TODO: Replace with actual database query
+        # query = self.db.query(Article).filter(Article.uniqueness_hash == uniqueness_hash).first()
+        # return query is not None
+        
+        if self._recently_stored([uniqueness_hash])[0]:
+            return True
+
+        # Skip the round-trip when the URL is definitely not stored yet
+        if not self._may_be_stored([url])[0]:
+            return False
+        
+        # Placeholder implementation
+        result = self.db.execute(
+            ARTICLE_EXISTS_SQL,
+            {"hash": uniqueness_hash, "url": url}
+        ).fetchone()
+        if result is not None:
+            self._remember_hashes([uniqueness_hash])
+        return result is not None
+    
+    def _find_existing_hashes(self, hashes: List[str], urls: List[str]) -> Set[str]:
+        """Return the subset of hashes whose article (matched by hash or URL) already exists"""
+        recent = self._recently_stored(hashes)
+        existing = {uniqueness_hash for uniqueness_hash, stored in zip(hashes, recent) if stored}
+
+        # Only confirm in SQL the URLs the bloom filter can't rule out
+        candidates = [
+            (uniqueness_hash, url)
+            for uniqueness_hash, url, stored, maybe in zip(hashes, urls, recent, self._may_be_stored(urls))
+            if maybe and not stored
+        ]
+        if not candidates:
+            return existing
+        hashes, urls = [list(column) for column in zip(*candidates)]
+
+        rows = self.db.execute(
+            EXISTING_ARTICLES_SQL,
+            {"hashes": list(hashes), "urls": list(urls)}
+        ).fetchall()
+        existing_hashes = {row.uniqueness_hash for row in rows}
+        existing_urls = {row.url for row in rows}
+        confirmed = [
+            uniqueness_hash for uniqueness_hash, url in zip(hashes, urls)
+            if uniqueness_hash in existing_hashes or url in existing_urls
+        ]
+        self._remember_hashes(confirmed)
+        return existing.union(confirmed)
+
+    def _seen_urls(self) -> Optional[ScalableBloomFilter]:
+        """Bloom filter of stored article URLs for this database, loaded on first use"""
+        key = str(self.db.get_bind().url)
+        with _seen_urls_lock:
+            seen = _seen_urls_by_db.get(key)
+            if seen is not None:
+                return seen
+
+            try:
+                seen = ScalableBloomFilter(initial_capacity=100000, error_rate=1e-4)
+                result = self.db.execute(STORED_URLS_SQL)
+                for url in result.scalars():
+                    seen.add(url)
+            except Exception as e:
+                logger.warning(f"Failed to load stored URLs into bloom filter: {str(e)}")
+                try:
+                    self.db.rollback()
+                except:
+                    pass
+                return None
+
+            _seen_urls_by_db[key] = seen
+            logger.info(f"Loaded {len(seen)} stored article URLs into bloom filter")
+            return seen
+
+    def _may_be_stored(self, urls: List[str]) -> List[bool]:
+        """Bloom filter check per URL: False means definitely not stored, True needs SQL to confirm"""
+        seen = self._seen_urls()
+        if seen is None:
+            return [True] * len(urls)
+        with _seen_urls_lock:
+            return [url in seen for url in urls]
+
+    def _remember_urls(self, urls: List[str]) -> None:
+        """Record newly stored article URLs in the bloom filter"""
+        with _seen_urls_lock:
+            seen = _seen_urls_by_db.get(str(self.db.get_bind().url))
+            if seen is not None:
+                for url in urls:
+                    seen.add(url)
+
+    def _recently_stored(self, hashes: List[str]) -> List[bool]:
+        """Recent-hash check per article: True means definitely stored, False needs the usual checks"""
+        with _recent_hashes_lock:
+            return [uniqueness_hash in _recent_hashes for uniqueness_hash in hashes]
+
+    def _remember_hashes(self, hashes: List[str]) -> None:
+        """Record uniqueness hashes known to be stored, evicting the least recently added past the cap"""
+        with _recent_hashes_lock:
+            for uniqueness_hash in hashes:
+                _recent_hashes[uniqueness_hash] = None
+                _recent_hashes.move_to_end(uniqueness_hash)
+            while len(_recent_hashes) > RECENT_HASHES_MAX:
+                _recent_hashes.popitem(last=False)
+
+    def _find_similar_articles(self, embedding: np.ndarray) -> List[Dict]:
+        """
+        Find articles with similar embeddings using pgvector
+        
+        Returns:
+            List of similar articles data
+        """
+        assert embedding.dtype == np.float32 and embedding.flags.c_contiguous
+        cache_key = embedding_key(embedding)
+        cached = _similarity_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            # Use pgvector's cosine similarity search
+            # The numpy array is bound directly by pgvector's psycopg2 adapter
+            results = self.db.execute(SIMILAR_ARTICLES_SQL, {
+                "embedding_param": embedding,
+                "candidates_param": HALFVEC_CANDIDATES,
+                "threshold_param": self.similarity_threshold
+            }).fetchall()
+            
+            similar = self._similar_from_rows(results)
+            _similarity_cache.put(cache_key, similar)
+            return similar
+            
+        except Exception as e:
+            logger.error(f"Failed to find similar articles: {str(e)}")
+            try:
+                self.db.rollback()
+            except:
+                pass
+            return []
+
+    def _find_similar_articles_batch(self, embeddings: List[np.ndarray]) -> List[List[Dict]]:
+        """
+        Find similar articles for many embeddings with a single pgvector query
+
+        Each embedding probes the index through a LATERAL join, so the whole batch
+        costs one round-trip instead of one per article.
+
+        Returns:
+            List aligned with embeddings of similar articles data
+        """
+        if len(embeddings) == 0:
+            return []
+
+        cache_keys = [embedding_key(embedding) for embedding in embeddings]
+        results: List[Optional[List[Dict]]] = [_similarity_cache.get(key) for key in cache_keys]
+        misses = [qid for qid, cached in enumerate(results) if cached is None]
+        if not misses:
+            return results
+
+        try:
+            params: Dict[str, Any] = {
+                "candidates_param": HALFVEC_CANDIDATES,
+                "threshold_param": self.similarity_threshold
+            }
+            values = []
+            for qid in misses:
+                params[f"v{qid}"] = embeddings[qid]
+                # VALUES columns have no type context, so this cast is still required
+                values.append(f"({qid}, CAST(:v{qid} AS vector))")
+
+            query = text(f"""
+                WITH queries(qid, qvec) AS (VALUES {', '.join(values)})
+                SELECT
+                    q.qid, a.article_id, a.title, a.summary, a.cluster_id, a.source_name,
+                    a.publication_timestamp, a.category, a.subcategory, a.tags, a.similarity
+                FROM queries q
+                JOIN LATERAL (
+                    SELECT
+                        article_id, title, summary, cluster_id, source_name, publication_timestamp,
+                        category, subcategory, tags,
+                        1 - (embedding <=> q.qvec) as similarity
+                    FROM (
+                        SELECT
+                            article_id, title, summary, cluster_id, source_name, publication_timestamp,
+                            category, subcategory, tags, embedding
+                        FROM articles
+                        ORDER BY embedding_f16 <=> CAST(q.qvec AS halfvec(768))
+                        LIMIT :candidates_param
+                    ) candidates
+                    WHERE 1 - (embedding <=> q.qvec) > :threshold_param
+                    ORDER BY embedding <=> q.qvec
+                    LIMIT 10
+                ) a ON true
+                ORDER BY q.qid, a.similarity DESC
+            """)
+
+            rows_by_query: Dict[int, List[Any]] = {qid: [] for qid in misses}
+            for row in self.db.execute(query, params).fetchall():
+                rows_by_query[row.qid].append(row)
+
+            for qid in misses:
+                results[qid] = self._similar_from_rows(rows_by_query[qid])
+                _similarity_cache.put(cache_keys[qid], results[qid])
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to find similar articles for batch: {str(e)}")
+            try:
+                self.db.rollback()
+            except:
+                pass
+            return [cached if cached is not None else [] for cached in results]
+
+    def _similar_from_rows(self, rows: List[Any]) -> List[Dict]:
+        """Convert similarity query rows into similar articles data"""
+        similar_articles = []
+        
+        for row in rows:
+            similar_articles.append({
+                'article_id': row.article_id,
+                'title': row.title,
+                'summary': row.summary,
+                'cluster_id': row.cluster_id,
+                'source_name': row.source_name,
+                'publication_timestamp': row.publication_timestamp,
+                'category': row.category,
+                'subcategory': row.subcategory,
+                'tags': row.tags,
+                'similarity': row.similarity
+            })
+        
+        return similar_articles
+    
+    def _add_batch_candidates(self, articles: List[Dict[str, Any]], embeddings: np.ndarray,
+                              similar_lists: List[List[Dict]], provisional_ids: List[str]) -> List[List[Dict]]:
+        """
+        Add the similar earlier articles of the same batch to each article's similar articles
+
+        A batch is stored only after every decision is made, so the pgvector lookup can't see
+        it; without this, two articles on a new story would each create a cluster. Earlier
+        articles are listed under their provisional cluster_id.
+
+        Returns:
+            New lists aligned with similar_lists, still sorted by similarity
+        """
+        scores = batched_cosine(embeddings, embeddings)
+        merged = []
+        for j, similar_articles in enumerate(similar_lists):
+            batch_candidates = [
+                {
+                    'article_id': None,
+                    'title': articles[i]['title'],
+                    'summary': articles[i].get('summary'),
+                    'cluster_id': provisional_ids[i],
+                    'source_name': articles[i]['source_name'],
+                    'publication_timestamp': articles[i].get('published_date'),
+                    'category': None,
+                    'subcategory': None,
+                    'tags': None,
+                    'similarity': float(scores[j, i])
+                }
+                for i in range(j) if scores[j, i] > self.similarity_threshold
+            ]
+            if batch_candidates:
+                # A new list: similar_articles may be shared with the similarity cache
+                similar_articles = sorted(similar_articles + batch_candidates, key=itemgetter('similarity'), reverse=True)
+            merged.append(similar_articles)
+        return merged
+
+    def _check_join_target(self, decision: Dict[str, Any], similar_articles: List[Dict]) -> Dict[str, Any]:
+        """
+        Make sure a join_existing decision points at a real candidate cluster
+
+        The AI judge can return a cluster_id that isn't one of the candidates (e.g. copied
+        from the few-shot examples); redirect those to the best candidate. Candidates come
+        from stored articles, so their cluster_ids already reference story_clusters rows.
+        """
+        if decision['action'] != 'join_existing':
+            return decision
+
+        candidate_ids = {str(article['cluster_id']) for article in similar_articles if article['cluster_id']}
+        if str(decision.get('cluster_id')) in candidate_ids:
+            return decision
+
+        fallback = next((article['cluster_id'] for article in similar_articles if article['cluster_id']), None)
+        if fallback:
+            logger.warning(f"AI judge chose unknown cluster {decision.get('cluster_id')}, joining {fallback} instead")
+            decision['cluster_id'] = fallback
+        else:
+            logger.warning(f"AI judge chose unknown cluster {decision.get('cluster_id')}, creating new cluster")
+            decision['action'] = 'create_new'
+            decision['cluster_id'] = None
+        return decision
+
+    def _auto_join_decision(self, similar_articles: List[Dict]) -> Optional[Dict[str, Any]]:
+        """
+        Join the top cluster without an LLM call when the best match is near-identical
+
+        Reuses the matched article's category, subcategory and tags. A small random sample
+        still goes through the AI judge so drift can be spotted.
+
+        Returns:
+            Clustering decision, or None if the AI judge should decide
+        """
+        if not similar_articles or similar_articles[0]['similarity'] < self.auto_join_threshold:
+            return None
+        if random.random() < self.auto_join_sample_rate:
+            return None
+
+        top = similar_articles[0]
+        try:
+            tags = orjson.loads(top['tags']) if top.get('tags') else []
+        except orjson.JSONDecodeError:
+            tags = []
+
+        logger.info(f"Auto-joined cluster {top['cluster_id']} (similarity {top['similarity']:.3f})")
+        return {
+            'action': 'join_existing',
+            'cluster_id': top['cluster_id'],
+            'reason': 'auto-joined: high similarity',
+            'category': top.get('category') or 'General',
+            'subcategory': top.get('subcategory'),
+            'tags': tags
+        }
+
+    def _ai_judge_clustering(self, new_article: Dict[str, Any], similar_articles: List[Dict]) -> Dict[str, Any]:
+        """
+        Use AI to determine if article should join existing cluster or create new one
+        """
+        # Use feed category if available, otherwise fall back to keyword categorization
+        feed_category = new_article.get('feed_category', self._categorize_article(new_article))
+        
+        if not similar_articles:
+            # Still call AI judge to generate subcategories and tags, even without similar articles
+            try:
+                # Use the existing clustering prompt but with empty similar_articles list
+                prompt = self._create_judge_prompt(new_article, similar_articles)
+                response = self.llm_service.generate_text(prompt)
+                return self._decision_from_response(new_article, similar_articles, response)
+                
+            except Exception as e:
+                logger.error(f"AI categorization failed: {str(e)}")
+                return {
+                    'action': 'create_new',
+                    'reason': 'No similar articles found, AI categorization failed',
+                    'category': feed_category,
+                    'subcategory': None,
+                    'tags': []
+                }
+        
+        try:
+            # Create prompt for AI judge
+            prompt = self._create_judge_prompt(new_article, similar_articles)
+            
+            # Get AI decision
+            response = self.llm_service.generate_text(prompt)
+            return self._decision_from_response(new_article, similar_articles, response)
+            
+        except Exception as e:
+            logger.error(f"AI judge failed, creating new cluster: {str(e)}")
+            return {
+                'action': 'create_new',
+                'reason': 'AI judge error',
+                'category': self._categorize_article(new_article),
+                'subcategory': None,
+                'tags': []
+            }
+
+    def _ai_judge_clustering_batch(self, articles: List[Dict[str, Any]],
+                                   similar_lists: List[List[Dict]]) -> List[Dict[str, Any]]:
+        """
+        Run the AI judge for a batch of articles with concurrent LLM calls
+
+        Articles whose LLM call fails are retried through the per-article path.
+        """
+        prompts = [
+            self._create_judge_prompt(article, similar_articles)
+            for article, similar_articles in zip(articles, similar_lists)
+        ]
+        responses = self.llm_service.generate_text_many(prompts, self.llm_concurrency)
+
+        decisions = []
+        for article, similar_articles, response in zip(articles, similar_lists, responses):
+            if response is None:
+                decisions.append(self._ai_judge_clustering(article, similar_articles))
+            else:
+                decisions.append(self._decision_from_response(article, similar_articles, response))
+        return decisions
+
+    def _create_judge_prompt(self, new_article: Dict[str, Any], similar_articles: List[Dict]) -> str:
+        """Create the AI judge prompt with context from the top similar articles"""
+        # Prepare context for AI judge from the closest few candidates only
+        similar_context = []
+        for article in self._prune_similar_articles(new_article, similar_articles):
+            similar_context.append({
+                'title': article['title'],
+                'summary': article['summary'],
+                'cluster_id': article['cluster_id'],
+                'similarity': article['similarity']
+            })
+        
+        return self._create_clustering_prompt(new_article, similar_context)
+
+    def _prune_similar_articles(self, new_article: Dict[str, Any], similar_articles: List[Dict]) -> List[Dict]:
+        """
+        Narrow pgvector hits to the LLM_CONTEXT_SIZE best candidates for the judge prompt
+
+        Candidates are re-ranked by title word overlap (cosine over token counts) with the
+        new article, using embedding similarity as the tie-breaker.
+        """
+        if len(similar_articles) <= LLM_CONTEXT_SIZE:
+            return similar_articles
+
+        # Token-count matrix: row 0 is the new title, then one row per candidate title
+        titles = [new_article['title']] + [article['title'] or '' for article in similar_articles]
+        token_lists = [_TOKEN_RE.findall(title.lower()) for title in titles]
+        vocabulary: Dict[str, int] = {}
+        for tokens in token_lists:
+            for token in tokens:
+                vocabulary.setdefault(token, len(vocabulary))
+
+        counts = np.zeros((len(titles), max(len(vocabulary), 1)), dtype=np.float32)
+        for row, tokens in enumerate(token_lists):
+            for token in tokens:
+                counts[row, vocabulary[token]] += 1
+
+        title_scores = batched_cosine(counts[0], counts[1:])
+        ranked = sorted(
+            range(len(similar_articles)),
+            key=lambda i: (title_scores[i], similar_articles[i]['similarity']),
+            reverse=True
+        )
+        return [similar_articles[i] for i in ranked[:LLM_CONTEXT_SIZE]]
+
+    def _decision_from_response(self, new_article: Dict[str, Any], similar_articles: List[Dict],
+                                response: str) -> Dict[str, Any]:
+        """Turn an AI judge response into a clustering decision"""
+        # Debug: Log the LLM response (no formatting work unless DEBUG is enabled)
+        logger.debug("LLM response for '%.50s...': %s", new_article['title'], response)
+        
+        decision = self._parse_ai_decision(response, similar_articles)
+
+        if not similar_articles:
+            # Ensure it's marked as create_new
+            decision['action'] = 'create_new'
+            decision['reason'] = 'No similar articles found'
+            decision['cluster_id'] = None
+        
+        return decision
+    
+    def _create_clustering_prompt(self, new_article: Dict[str, Any], similar_articles: List[Dict]) -> str:
+        """Create prompt for AI clustering decision"""
+
+        # Format publication date for new article
+        new_pub_date = new_article.get('publication_timestamp')
+        new_pub_str = new_pub_date.strftime('%Y-%m-%d %H:%M UTC') if new_pub_date else 'Unknown'
+
+        similar_blocks = []
+        for i, article in enumerate(similar_articles, 1):
+            # Calculate age relative to new article
+            article_pub_date = article.get('publication_timestamp')
+            if article_pub_date and new_pub_date:
+                age_hours = (new_pub_date - article_pub_date).total_seconds() / 3600
+                age_str = f"{age_hours:.1f} hours ago"
+                pub_str = article_pub_date.strftime('%Y-%m-%d %H:%M UTC')
+            else:
+                age_str = "Unknown"
+                pub_str = "Unknown"
+
+            similar_blocks.append(SIM_BLOCK_FMT.format(
+                i=i,
+                title=article['title'],
+                summary=article['summary'],
+                pub_str=pub_str,
+                age_str=age_str,
+                cluster_id=article['cluster_id'],
+                similarity=article['similarity']
+            ))
+
+        # Get feed category hint for few-shot examples only
+        feed_category = new_article.get('feed_category', self._categorize_article(new_article))
+        examples = self._get_few_shot_examples(feed_category)
+
+        return "".join([
+            PROMPT_HEADER_FMT.format(
+                title=new_article['title'],
+                summary=new_article.get('summary', 'No summary'),
+                source_name=new_article['source_name'],
+                pub_str=new_pub_str
+            ),
+            *similar_blocks,
+            PROMPT_FOOTER_FMT.format(subcategories_str=_SUBCATS_STR, examples=examples)
+        ])
+    
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _get_few_shot_examples(category: str) -> str:
+        """Get few-shot examples based on category"""
+        return _EXAMPLES.get(category, _DEFAULT_EXAMPLE)
+    
+    def _parse_ai_decision(self, response: str, similar_articles: List[Dict]) -> Dict[str, Any]:
+        """Parse AI response into clustering decision"""
+        try:
+            decision = orjson.loads(_strip_code_fence(response))
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Failed to parse AI decision: {str(e)}")
+            return _fallback_decision()
+        
+        # Validate decision
+        if not isinstance(decision, dict) or decision.get('action') not in ('join_existing', 'create_new'):
+            logger.warning(f"Failed to parse AI decision: invalid action in {response[:200]!r}")
+            return _fallback_decision()
+        
+        if decision['action'] == 'join_existing' and not decision.get('cluster_id'):
+            # Find the most similar cluster
+            if similar_articles:
+                decision['cluster_id'] = similar_articles[0]['cluster_id']
+            else:
+                decision['action'] = 'create_new'
+
+        # Automatically derive category from subcategory
+        subcategory = decision.get('subcategory')
+        if subcategory and isinstance(subcategory, str):
+            # Look up which category contains this subcategory
+            category_found = _SUBCAT_TO_CAT.get(subcategory)
+
+            if category_found:
+                decision['category'] = category_found
+                logger.info(f"Mapped subcategory '{subcategory}' → category '{category_found}'")
+            else:
+                # Subcategory not found in any category - log warning and default to General
+                logger.warning(f"Subcategory '{subcategory}' not found in RSS_FEEDS_CONFIG. Defaulting to 'General'")
+                decision['category'] = 'General'
+        else:
+            # No subcategory provided - default both
+            logger.warning("No subcategory in AI response. Defaulting to General/None")
+            decision['category'] = 'General'
+            decision['subcategory'] = None
+
+        # Parse importance_score if it's a string
+        if 'importance_score' in decision:
+            importance_score = decision['importance_score']
+            if isinstance(importance_score, (int, float)):
+                decision['importance_score'] = int(importance_score)
+            else:
+                # Extract first digit if it's a string like "8 (high importance)"
+                match = _IMPORTANCE_RE.search(str(importance_score))
+                decision['importance_score'] = int(match.group(1)) if match else 50  # Default to 50
+
+        return decision
+    
+    def _categorize_article(self, article_data: Dict[str, Any]) -> str:
+        """Simple categorization fallback"""
+        title_lower = article_data['title'].lower()
+        
+        # Single pass over the title; the earliest-listed category wins when several match
+        best_priority = len(_CATEGORY_KEYWORDS)
+        for _, priority in _CATEGORY_AUTOMATON.iter(title_lower):
+            if priority < best_priority:
+                best_priority = priority
+                if priority == 0:
+                    break
+        
+        if best_priority < len(_CATEGORY_KEYWORDS):
+            return _CATEGORY_KEYWORDS[best_priority][0]
+        return 'General'
+    
+    def _create_new_cluster(self, article_data: Dict[str, Any], decision: Dict[str, Any],
+                            created_at: Optional[datetime] = None) -> str:
+        """Create a new story cluster"""
+        cluster_row = self._build_cluster_row(article_data, decision, created_at)
+        cluster_id = cluster_row['cluster_id']
+        canonical_title = cluster_row['canonical_title']
+        
+        try:
+            # TODO: Replace with actual model insertion
+            # new_cluster = StoryCluster(
+            #     cluster_id=cluster_id,
+            #     canonical_title=canonical_title,
+            #     created_at=datetime.now(timezone.utc)
+            # )
+            # self.db.add(new_cluster)
+            
+            # Placeholder implementation
+            self.db.execute(INSERT_CLUSTER_SQL, cluster_row)
+            _similarity_cache.invalidate()
+            
             logger.info(f"Created new story cluster: {cluster_id} - {canonical_title}")
             return cluster_id
             
@@ -718,15 +1326,88 @@ Decision:
             logger.error(f"Failed to create new cluster: {str(e)}")
             raise
     
+    def _create_new_clusters_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert story_clusters rows with a single multi-row INSERT (caller commits)"""
+        if rows:
+            self.db.execute(*_multi_row_insert(INSERT_CLUSTER_HEAD_SQL, CLUSTER_ROW_SQL, rows))
+
+    def _save_articles_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert articles rows with a single multi-row INSERT (caller commits)"""
+        if rows:
+            self.db.execute(*_multi_row_insert(INSERT_ARTICLE_HEAD_SQL, ARTICLE_ROW_SQL, rows))
+
+    def _insert_rows_individually(self, new_cluster_rows: List[Optional[Dict[str, Any]]],
+                                  article_rows: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Insert each article (and its new cluster, if any) in its own transaction
+
+        Stops at the first database error other than a unique constraint violation.
+
+        Returns:
+            List aligned with article_rows: article ID if saved, None if it hit a constraint or wasn't tried
+        """
+        article_ids: List[Optional[str]] = []
+        for cluster_row, article_row in zip(new_cluster_rows, article_rows):
+            try:
+                if cluster_row is not None:
+                    self.db.execute(INSERT_CLUSTER_SQL, cluster_row)
+                self.db.execute(INSERT_ARTICLE_SQL, article_row)
+                self.db.commit()
+                article_ids.append(article_row['article_id'])
+            except IntegrityError as e:
+                logger.info(f"Article already exists (race condition): {article_row['title']} ({str(e)})")
+                self.db.rollback()
+                article_ids.append(None)
+            except SQLAlchemyError:
+                # Any other database failure is unlikely to clear for the next row; keep what was committed
+                logger.exception(f"Failed to insert article: {article_row['title']}")
+                self.db.rollback()
+                break
+        return article_ids + [None] * (len(article_rows) - len(article_ids))
+
+    def _build_cluster_row(self, article_data: Dict[str, Any], decision: Dict[str, Any],
+                           created_at: Optional[datetime] = None, cluster_id: Optional[str] = None) -> Dict[str, Any]:
+        """Build the story_clusters row for a new cluster (created_at defaults to now, cluster_id to a new UUIDv7)"""
+        return {
+            "cluster_id": cluster_id or generate_uuidv7(),  # Time-ordered, so new clusters insert at the hot end of the index
+            "canonical_title": article_data['title'],  # Use article title as canonical
+            "importance_score": decision.get('importance_score', 50),  # Default to 50 if not provided
+            "created_at": created_at or datetime.now(timezone.utc)
+        }
+
+    def _build_article_row(self, article_data: Dict[str, Any], uniqueness_hash: str,
+                           embedding: np.ndarray, cluster_id: str, decision: Dict[str, Any],
+                           created_at: Optional[datetime] = None) -> Dict[str, Any]:
+        """Build the articles row for a clustered article (created_at defaults to now)"""
+        assert embedding.dtype == np.float32 and embedding.flags.c_contiguous
+        tags = decision.get('tags', [])
+        return {
+            "article_id": generate_uuidv7(),
+            "cluster_id": cluster_id,
+            "url": article_data['url'],
+            "uniqueness_hash": uniqueness_hash,
+            "source_name": article_data['source_name'],
+            "title": article_data['title'],
+            "summary": article_data.get('summary'),
+            "publication_timestamp": article_data.get('published_date'),
+            "category": decision.get('category'),
+            "subcategory": decision.get('subcategory'),
+            "tags": orjson.dumps(tags).decode(),
+            "tags_lower": [tag.lower() for tag in tags],
+            "embedding": embedding,
+            "created_at": created_at or datetime.now(timezone.utc)
+        }
+
     def _save_article(self, article_data: Dict[str, Any], uniqueness_hash: str, 
-                     embedding: np.ndarray, cluster_id: str, decision: Dict[str, Any]) -> str:
+                     embedding: np.ndarray, cluster_id: str, decision: Dict[str, Any],
+                     created_at: Optional[datetime] = None) -> str:
         """Save article to database"""
-        article_id = str(uuid.uuid4())
+        article_row = self._build_article_row(
+            article_data, uniqueness_hash, embedding, cluster_id, decision, created_at
+        )
+        article_id = article_row['article_id']
         
         try:
-            # Convert embedding to list for JSON storage
-            embedding_list = embedding.tolist()
-            
             # TODO: Replace with actual model insertion
             # new_article = Article(
             #     article_id=article_id,
@@ -739,42 +1420,18 @@ Decision:
             #     publication_timestamp=article_data.get('published_date'),
             #     category=decision.get('category'),
             #     subcategory=decision.get('subcategory'),
-            #     tags=json.dumps(decision.get('tags', [])),
-            #     embedding=embedding_list
+            #     tags=orjson.dumps(decision.get('tags', [])).decode(),
+            #     embedding=embedding  # ndarray; pgvector's adapter binds it without tolist()
             # )
             # self.db.add(new_article)
             
             # Placeholder implementation
-            self.db.execute(
-                text("""
-                    INSERT INTO articles (
-                        article_id, cluster_id, url, uniqueness_hash, source_name,
-                        title, summary, publication_timestamp, category, subcategory,
-                        tags, embedding, created_at
-                    ) VALUES (
-                        :article_id, :cluster_id, :url, :uniqueness_hash, :source_name,
-                        :title, :summary, :publication_timestamp, :category, :subcategory,
-                        :tags, CAST(:embedding AS vector), :created_at
-                    )
-                """),
-                {
-                    "article_id": article_id,
-                    "cluster_id": cluster_id,
-                    "url": article_data['url'],
-                    "uniqueness_hash": uniqueness_hash,
-                    "source_name": article_data['source_name'],
-                    "title": article_data['title'],
-                    "summary": article_data.get('summary'),
-                    "publication_timestamp": article_data.get('published_date'),
-                    "category": decision.get('category'),
-                    "subcategory": decision.get('subcategory'),
-                    "tags": json.dumps(decision.get('tags', [])),
-                    "embedding": json.dumps(embedding_list),
-                    "created_at": datetime.now(timezone.utc)
-                }
-            )
+            self.db.execute(INSERT_ARTICLE_SQL, article_row)
             
             self.db.commit()
+            _similarity_cache.invalidate()
+            self._remember_urls([article_row['url']])
+            self._remember_hashes([uniqueness_hash])
             logger.info(f"Saved article: {article_id}")
             return article_id
             
@@ -784,6 +1441,8 @@ Decision:
             if 'unique constraint' in error_str and ('url' in error_str or 'uniqueness_hash' in error_str):
                 logger.info(f"Article already exists (race condition): {article_data['title']}")
                 self.db.rollback()
+                self._remember_urls([article_data['url']])
+                self._remember_hashes([uniqueness_hash])
                 return None  # Return None to indicate duplicate, not failure
             else:
                 logger.error(f"Failed to save article: {str(e)}")
@@ -28,6 +28,9 @@ class EmbeddingService:
         
         # We're using 768 dimensions to match our database schema
         self.output_dimensionality = 768
+
+        # Vertex AI accepts at most 250 texts per embedding request
+        self.max_batch_size = 250
         
     def generate_embedding(self, text: str) -> Optional[np.ndarray]:
         """
@@ -37,7 +40,7 @@ class EmbeddingService:
             text: The text to embed (title + summary)
             
         Returns:
-            numpy array of 768 dimensions or None if failed
+            float32 numpy array of 768 dimensions or None if failed
         """
         try:
             # Clean and prepare text
@@ -58,7 +61,7 @@ class EmbeddingService:
             
             if response and response.embeddings and len(response.embeddings) > 0:
                 # Convert to numpy array (get the first embedding)
-                embedding_vector = np.array(response.embeddings[0].values)
+                embedding_vector = np.array(response.embeddings[0].values, dtype=np.float32)
                 logger.debug(f"Generated embedding with shape: {embedding_vector.shape}")
                 return embedding_vector
             else:
@@ -69,6 +72,45 @@ class EmbeddingService:
             logger.error(f"Failed to generate embedding: {str(e)}")
             return None
     
+    def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts with one embedding request per chunk
+
+        Args:
+            texts: List of texts to embed (title + summary)
+
+        Returns:
+            float32 numpy array of shape (len(texts), 768), rows aligned with texts
+
+        Raises:
+            ValueError: If a text is empty or the API returns the wrong number of embeddings
+        """
+        clean_texts = [self._clean_text(text) for text in texts]
+        if not all(clean_texts):
+            raise ValueError("Empty text provided for embedding")
+
+        vectors = []
+        for start in range(0, len(clean_texts), self.max_batch_size):
+            chunk = clean_texts[start:start + self.max_batch_size]
+            response = self.client.models.embed_content(
+                model=self.model_name,
+                contents=chunk,
+                config={
+                    "output_dimensionality": self.output_dimensionality,
+                    "task_type": "RETRIEVAL_DOCUMENT"
+                }
+            )
+
+            embeddings = response.embeddings if response else None
+            if not embeddings or len(embeddings) != len(chunk):
+                raise ValueError(
+                    f"Expected {len(chunk)} embeddings, got {len(embeddings) if embeddings else 0}"
+                )
+            vectors.extend(embedding.values for embedding in embeddings)
+
+        logger.debug(f"Generated {len(vectors)} embeddings in one batch")
+        return np.array(vectors, dtype=np.float32).reshape(len(clean_texts), self.output_dimensionality)
+
     def generate_embeddings_batch(self, texts: List[str]) -> List[Optional[np.ndarray]]:
         """
         Generate embeddings for multiple texts in a batch
@@ -107,7 +149,7 @@ class EmbeddingService:
                     )
                     
                     if response and response.embeddings and len(response.embeddings) > 0:
-                        results[original_index] = np.array(response.embeddings[0].values)
+                        results[original_index] = np.array(response.embeddings[0].values, dtype=np.float32)
                         
                 except Exception as e:
                     logger.error(f"Failed to generate embedding for text {i}: {str(e)}")
@@ -1,6 +1,6 @@
 import logging
 import uuid
-import json
+import orjson
 import redis
 from datetime import datetime
 from typing import List, Dict, Any, Optional
@@ -77,10 +77,12 @@ _engine = create_engine(
     pool_size=5,          # Number of persistent connections
     max_overflow=10,      # Additional connections if pool exhausted
     pool_pre_ping=True,   # Verify connections before using (prevents stale connections)
+    pool_use_lifo=True,   # Most recently used first, so surplus pooled connections sit idle until pool_recycle or the server's idle timeout retires them
     pool_recycle=3600     # Recycle connections every hour (prevents "gone away" errors)
 )
 Base.metadata.create_all(_engine, checkfirst=True)
-_SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+# Public so other entry points (the /discover endpoint, Celery tasks) share this pool
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
 logger.info(f"✅ Shared database engine created: pool_size=5, max_overflow=10 (max 15 connections total)")
 
 class EpisodeService:
@@ -96,7 +98,7 @@ class EpisodeService:
         # Use the SHARED database engine and session maker
         # All EpisodeService instances share the same 15-connection pool
         self.engine = _engine
-        self.db_session = _SessionLocal
+        self.db_session = SessionLocal
 
     def set_episode_status(self, episode_id: str, status: str, stage: Optional[str] = None,
                           progress: Optional[int] = None, error: Optional[str] = None):
@@ -128,12 +130,13 @@ class EpisodeService:
         # Optionally store status in Redis with expiration (for real-time updates)
         if self.redis_client:
             try:
+                status_json = orjson.dumps(status_data)
                 key = f"episode_status:{episode_id}"
-                self.redis_client.setex(key, 3600, json.dumps(status_data))  # Expire in 1 hour
+                self.redis_client.setex(key, 3600, status_json)  # Expire in 1 hour
 
                 # Publish to pub/sub channel for real-time SSE updates
                 channel = f"episode_status:{episode_id}"
-                self.redis_client.publish(channel, json.dumps(status_data))
+                self.redis_client.publish(channel, status_json)
                 logger.info(f"Episode {episode_id} status published to Redis SSE")
             except Exception as e:
                 logger.warning(f"Failed to publish status update to Redis: {e}")
@@ -1,18 +1,179 @@
+import ahocorasick
+import io
 import logging
 import os
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from google import genai
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from agent.config import settings, config
 
 logger = logging.getLogger(__name__)
 
+# A script paragraph: from its first non-whitespace character up to the next blank line
+_PARAGRAPH_RE = re.compile(r"\S.*?(?=\n\n|\Z)", re.S)
+
+# Prompt templates, built once at import; only the dynamic slots are filled in per call
+INTRO_PROMPT_FMT = """
+            Generate a brief podcast intro (1-2 sentences max) for "Your Cast" - a personalized news podcast.
+
+            Today's topics: {topics_text}
+
+            Requirements:
+            - Create a VARIATION on the theme "Welcome to Your Cast, your world update without the noise"
+            - Be welcoming and conversational, not over-the-top
+            - Keep it under 20 words
+
+            Return ONLY the intro text, nothing else.
+            """
+
+INTRO_FOR_USER_PROMPT_FMT = """
+            Generate a brief podcast intro (1-2 sentences max) for "Your Cast" - a personalized news podcast.
+
+            User's name: {user_name}
+            Today's topics: {topics_text}
+
+            Requirements:
+            - Greet the user by name naturally (e.g., "Hey {user_name}!" or "{user_name}, welcome back!")
+            - Create a VARIATION on the theme "Welcome to Your Cast, your world update without the noise"
+            - Be welcoming and conversational, not over-the-top
+            - Keep it under 25 words
+
+            Return ONLY the intro text, nothing else.
+            """
+
+OUTRO_PROMPT = """
+        Generate a brief podcast outro (1 sentence max) for "Your Cast" - a personalized news podcast.
+
+        Requirements:
+        - Create a VARIATION on thanking the listener and signing off
+        - Be warm and conversational, not over-the-top
+        - Keep it under 15 words
+        - Examples: "That's your world update. Thanks for listening to Your Cast.", "And that's the news. Stay informed, stay curious."
+
+        Return ONLY the outro text, nothing else.
+        """
+
+SUMMARY_PROMPT_FMT = """
+        Please provide a concise summary of this news article in 4-6 bullet points. Focus on the key facts and developments, naming any key entities.
+
+        IMPORTANT GROUNDING RULE:
+        - Use ONLY information from the article text below
+        - DO NOT add context from your general knowledge
+        - DO NOT change titles, roles, or positions based on what you think you know
+        - Stick to the facts as stated in the article
+
+        Title: {title}
+
+        Article:
+        {article_text}  # Truncate to fit context
+
+        Summary (as bullet points):
+        """
+
+TOPIC_SCRIPT_PROMPT_FMT = """
+        SYSTEM ROLE: You are a professional podcast scriptwriter. Your output will be read DIRECTLY by text-to-speech software, so you must write in PLAIN TEXT ONLY - absolutely no formatting, no asterisks, no special characters.
+
+        TASK: Write a brief news segment for a podcast about {topic_name}.
+
+        CRITICAL GROUNDING RULE - READ THIS CAREFULLY:
+        - Use ONLY information explicitly stated in the provided news sources below
+        - DO NOT use your general knowledge or training data to fill in details
+        - DO NOT make assumptions about people's current roles, titles, or positions
+        - If a source says "President Donald Trump", use that exact phrasing - don't change it to "former President" or any other variation based on what you think you know
+        - If information is not in the sources, DO NOT include it
+        - When in doubt, stick to exactly what the article says, word for word
+
+        CRITICAL CONSTRAINT: Your response MUST be under {target_words} words total. This is NON-NEGOTIABLE.
+
+        FORMATTING RULES (MUST FOLLOW):
+        - Write in plain text ONLY - imagine you are speaking directly to a listener
+        - NO asterisks (*), stars, or markdown formatting like **bold** or *italic*
+        - NO special characters, markup, or symbols
+        - NO transition words between stories like "finally", "first up", "moving on", "in addition", "moreover"
+        - START with a brief natural intro to the topic (e.g., "In tech news...", "Turning to sports...", "On the political front...")
+        - NO formal welcomes or goodbyes
+
+        GOOD EXAMPLE (correct format):
+        "In business news, the S&P 500 closed at a record high on Friday, gaining 2.3 percent following strong earnings reports. According to Reuters, tech stocks led the rally with Apple and Microsoft both up over 4 percent. Jane Smith, chief economist at Goldman Sachs, noted that consumer spending remains robust despite inflation concerns."
+
+        BAD EXAMPLE (avoid this - has asterisks and transition words):
+        "**Finally**, let's talk about the markets. The S&P 500..."
+
+        CONTENT GUIDELINES:
+        1. Assume the listener knows nothing - provide context about who people are and what's happening
+        2. Cover only the most important highlights from the sources
+        3. Use direct quotes from people in the articles to add credibility
+        4. Cite sources naturally (e.g., "According to Reuters...", "As reported by BBC...")
+        5. Include specific dates when discussing events if it adds context (e.g., "On October 30th...", "November 2nd...") - avoid relative dates like "Tuesday" or "last week"
+        6. Be {target_style}
+        7. Flow as a single narrative voice
+        8. Report news objectively - no warnings or personal opinions
+
+        News Sources about {topic_name}:
+        {sources_text}
+        """
+
+TITLE_PROMPT_FMT = """
+        Generate a compelling podcast episode title based on these top stories.
+
+        Top 3 stories:
+        {top_articles_text}
+
+        The title should be:
+        - Engaging and clickable
+        - Under 60 characters
+        - Reflective of the main stories covered
+        - Professional but accessible
+
+        Return just the title, no quotes or extra text.
+        """
+
+DESCRIPTION_PROMPT_FMT = """Generate a concise, engaging 1-2 sentence description for a news podcast episode covering these stories:
+
+{stories_text}
+
+The description should:
+- Be natural and conversational (not a list)
+- Highlight the main themes or most interesting stories
+- Be brief (under 200 characters if possible)
+- Not use phrases like "this episode covers" or "we discuss"
+
+Just write the description directly, no preamble."""
+
 @dataclass
 class PodcastScript:
     paragraphs: List[Dict[str, Any]]
     estimated_duration: int
     topics: List[Dict[str, Any]]  # List of topics with their metadata
 
+@dataclass(slots=True)
+class _ScriptSource:
+    """Source fields used for script generation, with their defaults applied once"""
+    id: str
+    title: str
+    url: str
+    source_name: str
+    full_text: str
+    summary: str
+    subcategory: str
+
+    @classmethod
+    def from_dict(cls, source: Dict[str, Any]) -> "_ScriptSource":
+        full_text = source.get("full_text") or ""
+        return cls(
+            id=source["id"],
+            title=source["title"],
+            url=source["url"],
+            source_name=source.get("source_name", "Unknown"),
+            full_text=full_text,
+            summary=source.get("summary") or full_text,
+            subcategory=source.get("subcategory", "General News")
+        )
+
 class LLMService:
     # World News subcategories that should be grouped together
     WORLD_NEWS_SUBCATEGORIES = {
@@ -35,69 +196,73 @@ class LLMService:
             location=location
         )
         self.model_name = 'gemini-2.0-flash-lite'
+        # Subcategory -> topic lookup; subcategories not listed are their own topic
+        self._topic_map = {subcategory: "World News" for subcategory in self.WORLD_NEWS_SUBCATEGORIES}
+
+        # The target style is fixed for the process, so bake it into the topic template once
+        self._topic_script_prompt_fmt = TOPIC_SCRIPT_PROMPT_FMT.replace(
+            "{target_style}", config.llm_target_style.replace("{", "{{").replace("}", "}}")
+        )
 
     def _normalize_topic_name(self, subcategory: str) -> str:
         """Map world news subcategories to 'World News', keep others as-is"""
-        if subcategory in self.WORLD_NEWS_SUBCATEGORIES:
-            return "World News"
-        return subcategory
+        return self._topic_map.get(subcategory, subcategory)
 
     def generate_podcast_script(self, sources: List[Dict[str, Any]], duration_minutes: int, user_name: str = None) -> PodcastScript:
         """Generate a podcast script from news sources, organized by topic"""
         target_words = duration_minutes * config.llm_words_per_minute  # Configurable WPM target
 
         # Group sources by subcategory (topic), mapping world news subcategories to "World News"
-        topics_map = {}
-        for source in sources:
-            subcategory = source.get("subcategory", "General News")
-            topic_name = self._normalize_topic_name(subcategory)
-            if topic_name not in topics_map:
-                topics_map[topic_name] = []
-            topics_map[topic_name].append(source)
+        topics_map = defaultdict(list)
+        for source in map(_ScriptSource.from_dict, sources):
+            topics_map[self._topic_map.get(source.subcategory, source.subcategory)].append(source)
+        # Plain dict from here on, so a stray lookup can't silently add an empty topic
+        topics_map = dict(topics_map)
 
         logger.info(f"Grouped {len(sources)} sources into {len(topics_map)} topics: {list(topics_map.keys())}")
 
+        # Summarize every article long enough to be worth an LLM call concurrently;
+        # each summary is an independent Gemini round-trip
+        min_summarize_chars = config.llm_min_summarize_chars
+        to_summarize = [
+            source for topic_sources in topics_map.values() for source in topic_sources
+            if len(source.full_text) > min_summarize_chars
+        ]
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            article_summaries = dict(zip(
+                (id(source) for source in to_summarize),
+                executor.map(self._summarize_source, to_summarize)
+            ))
+
         # Prepare summaries grouped by topic
         topics_data = []
         for topic_name, topic_sources in topics_map.items():
             summaries = []
             for source in topic_sources:
-                full_text = source.get("full_text", "")
-
-                # Only summarize if we have substantial content (more than just RSS summary)
-                if full_text and len(full_text) > 500:
-                    # We have full article text - summarize it for title/description only
-                    try:
-                        summary = self._summarize_article(full_text, source["title"])
-                        summaries.append({
-                            "source_id": source["id"],
-                            "title": source["title"],
-                            "summary": summary,  # Used for title/description
-                            "full_text": full_text,  # Used for script generation
-                            "url": source["url"],
-                            "source_name": source.get("source_name", "Unknown")
-                        })
-                    except Exception as e:
-                        logger.warning(f"Failed to summarize article {source['title']}: {str(e)}")
-                        # Fallback to RSS summary
-                        summaries.append({
-                            "source_id": source["id"],
-                            "title": source["title"],
-                            "summary": source.get("summary", ""),
-                            "full_text": full_text,  # Still use full text for script
-                            "url": source["url"],
-                            "source_name": source.get("source_name", "Unknown")
-                        })
+                full_text = source.full_text
+
+                # Only summarize if we have substantial content (shorter text is used as-is)
+                if len(full_text) > min_summarize_chars:
+                    # We have full article text - summarized above for title/description only,
+                    # falling back to the RSS summary if that failed
+                    summary = article_summaries[id(source)]
+                    if summary is None:
+                        summary = source.summary
+                    script_source = full_text  # Full text is always used for the script
                 else:
                     # Short content or just RSS summary - use it directly
-                    summaries.append({
-                        "source_id": source["id"],
-                        "title": source["title"],
-                        "summary": source.get("summary", full_text),
-                        "full_text": full_text or source.get("summary", ""),  # Use whatever we have
-                        "url": source["url"],
-                        "source_name": source.get("source_name", "Unknown")
-                    })
+                    summary = source.summary
+                    script_source = full_text or source.summary  # Use whatever we have
+
+                summaries.append({
+                    "source_id": source.id,
+                    "title": source.title,
+                    "summary": summary,  # Used for title/description
+                    "full_text": script_source,  # Used for script generation
+                    "full_text_trunc": script_source[:5000],  # Truncated once for the topic prompt
+                    "url": source.url,
+                    "source_name": source.source_name
+                })
 
             topics_data.append({
                 "topic_name": topic_name,
@@ -107,12 +272,24 @@ class LLMService:
         # Calculate words per topic
         words_per_topic = target_words // len(topics_data) if topics_data else target_words
 
-        # Generate script for each topic separately
+        # Generate intro, every topic script and outro concurrently; each is an independent Gemini call
+        # A thread pool rather than asyncio.run, so this also works from inside a running event loop
+        def topic_script(topic_data: Dict[str, Any]) -> str:
+            logger.info(f"Generating script for topic: {topic_data['topic_name']}")
+            return self._generate_topic_script(topic_data["topic_name"], topic_data["summaries"], words_per_topic)
+
+        with ThreadPoolExecutor(max_workers=len(topics_data) + 2) as executor:
+            intro_future = executor.submit(self._generate_intro, None, list(topics_map.keys()))
+            outro_future = executor.submit(self._generate_outro)
+            topic_scripts = list(executor.map(topic_script, topics_data))
+            intro_text = intro_future.result()
+            outro_text = outro_future.result()
+
+        # Assemble the script in its original order
         all_paragraphs = []
         topics_metadata = []
 
-        # Generate dynamic intro (not using user_name for now)
-        intro_text = self._generate_intro(None, list(topics_map.keys()))
+        # Dynamic intro (not using user_name for now)
         intro_paragraph = {
             "text": intro_text,
             "source_ids": [],
@@ -120,15 +297,10 @@ class LLMService:
         }
         all_paragraphs.append(intro_paragraph)
 
-        for topic_data in topics_data:
+        for topic_data, script_text in zip(topics_data, topic_scripts):
             topic_name = topic_data["topic_name"]
             summaries = topic_data["summaries"]
 
-            logger.info(f"Generating script for topic: {topic_name}")
-
-            # Generate focused script for this topic
-            script_text = self._generate_topic_script(topic_name, summaries, words_per_topic)
-
             # Keep topic script as single block (don't split into paragraphs)
             # Collect all source IDs for this topic
             topic_source_ids = [s["source_id"] for s in summaries]
@@ -149,8 +321,7 @@ class LLMService:
                 "source_ids": topic_source_ids
             })
 
-        # Generate outro
-        outro_text = self._generate_outro()
+        # Outro
         outro_paragraph = {
             "text": outro_text,
             "source_ids": [],
@@ -170,33 +341,9 @@ class LLMService:
 
         # If no user name, generate a generic but varied intro
         if not user_name:
-            prompt = f"""
-            Generate a brief podcast intro (1-2 sentences max) for "Your Cast" - a personalized news podcast.
-
-            Today's topics: {topics_text}
-
-            Requirements:
-            - Create a VARIATION on the theme "Welcome to Your Cast, your world update without the noise"
-            - Be welcoming and conversational, not over-the-top
-            - Keep it under 20 words
-
-            Return ONLY the intro text, nothing else.
-            """
+            prompt = INTRO_PROMPT_FMT.format(topics_text=topics_text)
         else:
-            prompt = f"""
-            Generate a brief podcast intro (1-2 sentences max) for "Your Cast" - a personalized news podcast.
-
-            User's name: {user_name}
-            Today's topics: {topics_text}
-
-            Requirements:
-            - Greet the user by name naturally (e.g., "Hey {user_name}!" or "{user_name}, welcome back!")
-            - Create a VARIATION on the theme "Welcome to Your Cast, your world update without the noise"
-            - Be welcoming and conversational, not over-the-top
-            - Keep it under 25 words
-
-            Return ONLY the intro text, nothing else.
-            """
+            prompt = INTRO_FOR_USER_PROMPT_FMT.format(user_name=user_name, topics_text=topics_text)
 
         try:
             response = self.client.models.generate_content(model=self.model_name, contents=prompt)
@@ -212,17 +359,7 @@ class LLMService:
 
     def _generate_outro(self) -> str:
         """Generate a brief, varied outro"""
-        prompt = """
-        Generate a brief podcast outro (1 sentence max) for "Your Cast" - a personalized news podcast.
-
-        Requirements:
-        - Create a VARIATION on thanking the listener and signing off
-        - Be warm and conversational, not over-the-top
-        - Keep it under 15 words
-        - Examples: "That's your world update. Thanks for listening to Your Cast.", "And that's the news. Stay informed, stay curious."
-
-        Return ONLY the outro text, nothing else.
-        """
+        prompt = OUTRO_PROMPT
 
         try:
             response = self.client.models.generate_content(model=self.model_name, contents=prompt)
@@ -234,24 +371,17 @@ class LLMService:
             # Fallback to static outro
             return "That's your world update. Thanks for listening to Your Cast."
 
-    def _summarize_article(self, full_text: str, title: str) -> str:
-        """Summarize a single article"""
-        prompt = f"""
-        Please provide a concise summary of this news article in 4-6 bullet points. Focus on the key facts and developments, naming any key entities.
-
-        IMPORTANT GROUNDING RULE:
-        - Use ONLY information from the article text below
-        - DO NOT add context from your general knowledge
-        - DO NOT change titles, roles, or positions based on what you think you know
-        - Stick to the facts as stated in the article
-
-        Title: {title}
-
-        Article:
-        {full_text[:2000]}  # Truncate to fit context
+    def _summarize_source(self, source: _ScriptSource) -> Optional[str]:
+        """Summarize one source's full text, returning None if summarization fails"""
+        try:
+            return self._summarize_article(source.full_text[:2000], source.title)
+        except Exception as e:
+            logger.warning(f"Failed to summarize article {source.title}: {str(e)}")
+            return None
 
-        Summary (as bullet points):
-        """
+    def _summarize_article(self, article_text: str, title: str) -> str:
+        """Summarize a single article from its text, already truncated to fit the context"""
+        prompt = SUMMARY_PROMPT_FMT.format(title=title, article_text=article_text)
         
         try:
             response = self.client.models.generate_content(model=self.model_name, contents=prompt)
@@ -263,57 +393,28 @@ class LLMService:
     
     def _generate_topic_script(self, topic_name: str, summaries: List[Dict], target_words: int) -> str:
         """Generate script for a single topic section"""
-        sources_text = "\n\n".join([
-            f"Source {i+1} - {s['title']} ({s['source_name']}):\n{s['full_text'][:5000]}\nURL: {s['url']}"
-            for i, s in enumerate(summaries)
-        ])
-
-        prompt = f"""
-        SYSTEM ROLE: You are a professional podcast scriptwriter. Your output will be read DIRECTLY by text-to-speech software, so you must write in PLAIN TEXT ONLY - absolutely no formatting, no asterisks, no special characters.
-
-        TASK: Write a brief news segment for a podcast about {topic_name}.
-
-        CRITICAL GROUNDING RULE - READ THIS CAREFULLY:
-        - Use ONLY information explicitly stated in the provided news sources below
-        - DO NOT use your general knowledge or training data to fill in details
-        - DO NOT make assumptions about people's current roles, titles, or positions
-        - If a source says "President Donald Trump", use that exact phrasing - don't change it to "former President" or any other variation based on what you think you know
-        - If information is not in the sources, DO NOT include it
-        - When in doubt, stick to exactly what the article says, word for word
-
-        CRITICAL CONSTRAINT: Your response MUST be under {target_words} words total. This is NON-NEGOTIABLE.
-
-        FORMATTING RULES (MUST FOLLOW):
-        - Write in plain text ONLY - imagine you are speaking directly to a listener
-        - NO asterisks (*), stars, or markdown formatting like **bold** or *italic*
-        - NO special characters, markup, or symbols
-        - NO transition words between stories like "finally", "first up", "moving on", "in addition", "moreover"
-        - START with a brief natural intro to the topic (e.g., "In tech news...", "Turning to sports...", "On the political front...")
-        - NO formal welcomes or goodbyes
-
-        GOOD EXAMPLE (correct format):
-        "In business news, the S&P 500 closed at a record high on Friday, gaining 2.3 percent following strong earnings reports. According to Reuters, tech stocks led the rally with Apple and Microsoft both up over 4 percent. Jane Smith, chief economist at Goldman Sachs, noted that consumer spending remains robust despite inflation concerns."
-
-        BAD EXAMPLE (avoid this - has asterisks and transition words):
-        "**Finally**, let's talk about the markets. The S&P 500..."
-
-        CONTENT GUIDELINES:
-        1. Assume the listener knows nothing - provide context about who people are and what's happening
-        2. Cover only the most important highlights from the sources
-        3. Use direct quotes from people in the articles to add credibility
-        4. Cite sources naturally (e.g., "According to Reuters...", "As reported by BBC...")
-        5. Include specific dates when discussing events if it adds context (e.g., "On October 30th...", "November 2nd...") - avoid relative dates like "Tuesday" or "last week"
-        6. Be {config.llm_target_style}
-        7. Flow as a single narrative voice
-        8. Report news objectively - no warnings or personal opinions
-
-        News Sources about {topic_name}:
-        {sources_text}
-        """
+        # Build the sources block in one buffer instead of joining per-source strings
+        buffer = io.StringIO()
+        for i, s in enumerate(summaries):
+            if i:
+                buffer.write("\n\n")
+            buffer.write(f"Source {i+1} - {s['title']} ({s['source_name']}):\n")
+            buffer.write(s['full_text_trunc'])
+            buffer.write("\nURL: ")
+            buffer.write(s['url'])
+        sources_text = buffer.getvalue()
+
+        prompt = self._topic_script_prompt_fmt.format(
+            topic_name=topic_name, target_words=target_words, sources_text=sources_text
+        )
 
         try:
-            response = self.client.models.generate_content(model=self.model_name, contents=prompt)
-            return response.text
+            # Stream the script so chunks are read off the connection as they are generated
+            chunks = []
+            for chunk in self.client.models.generate_content_stream(model=self.model_name, contents=prompt):
+                if chunk.text:
+                    chunks.append(chunk.text)
+            return "".join(chunks)
         except Exception as e:
             logger.error(f"Failed to generate script for topic {topic_name}: {str(e)}")
             raise
@@ -321,18 +422,28 @@ class LLMService:
     def _parse_script_paragraphs(self, script_text: str, summaries: List[Dict], topic_name: str) -> List[Dict[str, Any]]:
         """Parse script into paragraphs with source attribution and topic metadata"""
         paragraphs = []
-        script_paragraphs = [p.strip() for p in script_text.split("\n\n") if p.strip()]
 
-        for paragraph_text in script_paragraphs:
+        # Simple heuristic: a source is referenced if one of its title keywords is mentioned
+        # One automaton over every source's keywords (first 3 words of title) scans each paragraph once
+        keyword_sources: Dict[str, List[int]] = {}
+        for index, summary in enumerate(summaries):
+            for word in summary["title"].lower().split()[:3]:
+                if len(word) > 3:
+                    keyword_sources.setdefault(word, []).append(index)
+
+        automaton = ahocorasick.Automaton()
+        for word, indices in keyword_sources.items():
+            automaton.add_word(word, indices)
+        automaton.make_automaton()
+
+        for match in _PARAGRAPH_RE.finditer(script_text):
+            paragraph_text = match.group(0).strip()
             # Try to identify which sources are referenced in this paragraph
-            source_ids = []
-
-            for summary in summaries:
-                # Simple heuristic: if title keywords or source name mentioned
-                title_words = summary["title"].lower().split()[:3]  # First 3 words of title
-
-                if any(word in paragraph_text.lower() for word in title_words if len(word) > 3):
-                    source_ids.append(summary["source_id"])
+            referenced = set()
+            if keyword_sources:
+                for _, indices in automaton.iter(paragraph_text.lower()):
+                    referenced.update(indices)
+            source_ids = [summary["source_id"] for index, summary in enumerate(summaries) if index in referenced]
 
             paragraphs.append({
                 "text": paragraph_text,
@@ -349,20 +460,7 @@ class LLMService:
         top_articles = [s["title"] for s in sorted_sources[:3]]
         top_articles_text = "\n".join([f"- {title}" for title in top_articles])
 
-        prompt = f"""
-        Generate a compelling podcast episode title based on these top stories.
-
-        Top 3 stories:
-        {top_articles_text}
-
-        The title should be:
-        - Engaging and clickable
-        - Under 60 characters
-        - Reflective of the main stories covered
-        - Professional but accessible
-
-        Return just the title, no quotes or extra text.
-        """
+        prompt = TITLE_PROMPT_FMT.format(top_articles_text=top_articles_text)
 
         try:
             response = self.client.models.generate_content(model=self.model_name, contents=prompt)
@@ -382,17 +480,7 @@ class LLMService:
         for source in sorted_sources[:8]:  # Top 8 stories
             source_summaries.append(f"- {source['title']}")
 
-        prompt = f"""Generate a concise, engaging 1-2 sentence description for a news podcast episode covering these stories:
-
-{chr(10).join(source_summaries)}
-
-The description should:
-- Be natural and conversational (not a list)
-- Highlight the main themes or most interesting stories
-- Be brief (under 200 characters if possible)
-- Not use phrases like "this episode covers" or "we discuss"
-
-Just write the description directly, no preamble."""
+        prompt = DESCRIPTION_PROMPT_FMT.format(stories_text="\n".join(source_summaries))
 
         try:
             response = self.client.models.generate_content(model=self.model_name, contents=prompt)
@@ -413,3 +501,57 @@ Just write the description directly, no preamble."""
         except Exception as e:
             logger.error(f"Failed to generate text with Gemini: {str(e)}")
             raise
+
+    def generate_text_many(self, prompts: List[str], max_concurrency: int) -> List[Optional[str]]:
+        """
+        Generate text responses for many prompts concurrently
+
+        Args:
+            prompts: Prompts to send to the model
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Responses aligned with prompts (None where the request failed)
+        """
+        # A thread pool rather than asyncio.run, so this also works when called from inside a running
+        # event loop (e.g. the async /discover endpoint); the sync client is thread-safe
+        def generate(prompt: str) -> Optional[str]:
+            try:
+                return self.generate_text(prompt)
+            except Exception:
+                return None
+
+        if not prompts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(prompts)))) as executor:
+            return list(executor.map(generate, prompts))
+
+    def _warmup(self) -> None:
+        """Send a tiny request so DNS, TLS and the auth token are ready before the first real call"""
+        try:
+            self.client.models.generate_content(
+                model=self.model_name,
+                contents="hi",
+                config={"max_output_tokens": 1, "http_options": {"timeout": 10000}}
+            )
+            logger.info("Warmed up Gemini client connection")
+        except Exception as e:
+            logger.warning(f"Gemini client warmup failed: {str(e)}")
+
+
+# Process-wide LLMService (created on first use); the lock keeps a request that arrives
+# during the startup warmup from building a second client
+_llm_service: Optional[LLMService] = None
+_llm_service_lock = threading.Lock()
+
+
+def get_llm_service() -> LLMService:
+    """Process-wide LLMService, so every caller shares one warmed-up Gemini client"""
+    global _llm_service
+    with _llm_service_lock:
+        if _llm_service is None:
+            llm_service = LLMService()
+            llm_service._warmup()
+            _llm_service = llm_service
+        return _llm_service
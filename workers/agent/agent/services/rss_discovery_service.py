@@ -122,20 +122,20 @@ class RSSDiscoveryService:
                     articles_to_process.append(article_data)
                     result['articles_discovered'] += 1
             
-            # Process through clustering service
-            for article_data in articles_to_process:
-                try:
-                    article_id = self.clustering_service.process_article(article_data)
-                    result['articles_processed'] += 1
-                    
+            # Process through clustering service as one batch
+            try:
+                article_ids = self.clustering_service.process_articles_batch(articles_to_process)
+                result['articles_processed'] += len(article_ids)
+
+                for article_id in article_ids:
                     if article_id:
                         result['new_articles'] += 1
                     else:
                         result['duplicates_skipped'] += 1
-                        
-                except Exception as e:
-                    logger.error(f"Failed to process article {article_data.get('title', 'Unknown')}: {str(e)}")
-                    result['errors'] += 1
+
+            except Exception as e:
+                logger.error(f"Failed to process articles from {feed_url}: {str(e)}")
+                result['errors'] += len(articles_to_process)
             
             logger.info(f"Feed processed: {result['new_articles']} new articles from {feed_url}")
             return result
@@ -0,0 +1,63 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+
+def embedding_key(embedding: np.ndarray) -> bytes:
+    """
+    Fingerprint an embedding for cache lookups
+
+    Components are quantized to 1/1024 steps first, so near-identical embeddings
+    (e.g. wire-service copies of the same story) share a key.
+    """
+    quantized = np.round(np.asarray(embedding) * 1024).astype(np.int16)
+    return hashlib.blake2b(quantized.tobytes(), digest_size=16).digest()
+
+
+class QueryCache:
+    """Thread-safe LRU cache with TTL expiry and generation-based invalidation"""
+
+    def __init__(self, max_size: int = 2000, ttl_seconds: float = 300):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[int, float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value, or None if missing, expired or invalidated"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            generation, stored_at, value = entry
+            if generation != self._generation or time.monotonic() - stored_at > self.ttl_seconds:
+                # Stale entries are evicted lazily on lookup
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: bytes, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (self._generation, time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Mark every cached entry stale (call after writes that can change results)"""
+        with self._lock:
+            self._generation += 1
@@ -1,5 +1,5 @@
 import logging
-import json
+import orjson
 import os
 import shutil
 from typing import List, Dict, Any, Optional
@@ -97,8 +97,8 @@ class StorageService:
         os.makedirs(episode_dir, exist_ok=True)
 
         storage_path = os.path.join(episode_dir, f"{episode_id}.json")
-        with open(storage_path, 'w', encoding='utf-8') as f:
-            json.dump(transcript_data, f, indent=2, ensure_ascii=False)
+        with open(storage_path, 'wb') as f:
+            f.write(orjson.dumps(transcript_data, option=orjson.OPT_INDENT_2))
 
         absolute_url = f"{self.config.storage_base_url}/transcripts/{episode_id}.json"
         logger.info(f"Stored transcript for episode {episode_id} at {storage_path}")
@@ -109,8 +109,8 @@ class StorageService:
         blob_name = f"transcripts/{episode_id}.json"
         blob = self.bucket.blob(blob_name)
 
-        json_str = json.dumps(transcript_data, indent=2, ensure_ascii=False)
-        blob.upload_from_string(json_str, content_type="application/json")
+        json_bytes = orjson.dumps(transcript_data, option=orjson.OPT_INDENT_2)
+        blob.upload_from_string(json_bytes, content_type="application/json")
 
         public_url = f"https://storage.googleapis.com/{self.bucket_name}/{blob_name}"
         logger.info(f"Stored transcript for episode {episode_id} at {public_url}")
@@ -1,13 +1,12 @@
 import logging
 from celery import shared_task
 from datetime import datetime
-from sqlalchemy.orm import sessionmaker
 
-from agent.config import settings
+from agent.services.episode_service import SessionLocal
 from agent.services.rss_discovery_service import RSSDiscoveryService
 
-# TODO: Import database connection - adjust path as needed
-# from app.database.connection import engine
+# Sessions come from the engine shared with EpisodeService so each worker
+# process keeps a single connection pool.
 
 logger = logging.getLogger(__name__)
 
@@ -21,17 +20,6 @@ def discover_rss_articles(self, max_articles_per_feed: int = 20):
     logger.info("Starting RSS discovery task...")
     
     try:
-        # TODO: Replace with actual database session creation
-        # SessionLocal = sessionmaker(bind=engine)
-        # db = SessionLocal()
-        
-        # For now, we'll need to create a proper database connection
-        # This is a placeholder that needs to be updated with actual DB connection
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url)
-        SessionLocal = sessionmaker(bind=engine)
         db = SessionLocal()
         
         try:
@@ -85,11 +73,6 @@ def get_recent_clusters(self, hours: int = 24, limit: int = 20):
     logger.info(f"Fetching recent clusters from last {hours} hours...")
     
     try:
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url)
-        SessionLocal = sessionmaker(bind=engine)
         db = SessionLocal()
         
         try:
@@ -119,11 +102,6 @@ def manual_rss_discovery(self, feed_urls: list = None, max_articles: int = 10):
     logger.info("Starting manual RSS discovery...")
     
     try:
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        
-        engine = create_engine(settings.database_url)
-        SessionLocal = sessionmaker(bind=engine)
         db = SessionLocal()
         
         try:
@@ -0,0 +1,29 @@
+"""
+Vector math helpers shared by the clustering pipeline
+"""
+import numpy as np
+
+
+def batched_cosine(q: np.ndarray, mat: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of one query vector against every row of a matrix.
+
+    Both sides are normalized once and scored with a single matrix-vector product.
+    For a (m, d) query matrix the same call computes all m x k scores as one GEMM.
+
+    Args:
+        q: Query vector of shape (d,), or query matrix of shape (m, d)
+        mat: Candidate matrix of shape (k, d)
+
+    Returns:
+        Array of shape (k,) (or (m, k) for a query matrix); rows with zero norm score 0
+    """
+    q = np.asarray(q, dtype=np.float32)
+    mat = np.asarray(mat, dtype=np.float32)
+
+    q_norms = np.linalg.norm(q, axis=-1, keepdims=True)
+    mat_norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    q_unit = np.divide(q, q_norms, out=np.zeros_like(q), where=q_norms > 0)
+    mat_unit = np.divide(mat, mat_norms, out=np.zeros_like(mat), where=mat_norms > 0)
+
+    return q_unit @ mat_unit.T
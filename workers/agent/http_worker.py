@@ -5,11 +5,13 @@ HTTP Worker - Receives podcast generation jobs from Cloud Tasks via HTTP POST
 
 import logging
 import json
+import threading
 from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 from typing import List
 from agent.pipeline.podcast_generator import PodcastGenerator
 from agent.services.episode_service import EpisodeService
+from agent.services.llm_service import get_llm_service
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +32,21 @@ class GenerateEpisodeRequest(BaseModel):
     custom_tags: List[str] = []
 
 
+def _warm_up_llm_service():
+    try:
+        get_llm_service()
+    except Exception as e:
+        # Only /generate needs the LLM; it will retry (and report) the setup itself
+        logger.warning(f"LLM service warmup failed: {str(e)}")
+
+
+@app.on_event("startup")
+def warm_up_llm_client():
+    """Create the shared LLM service in the background so the first job doesn't pay for connection setup"""
+    # Off the boot path: the warmup makes a network call, and /health must come up without it
+    threading.Thread(target=_warm_up_llm_service, name="llm-warmup", daemon=True).start()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Cloud Run"""
@@ -116,13 +133,9 @@ async def discover_articles():
 
     try:
         from agent.services.rss_discovery_service import RSSDiscoveryService
-        from agent.config import settings
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
+        from agent.services.episode_service import SessionLocal
 
-        # Create database connection
-        engine = create_engine(settings.database_url)
-        SessionLocal = sessionmaker(bind=engine)
+        # Reuse the shared EpisodeService engine instead of opening a new pool per request
         db = SessionLocal()
 
         # Initialize service
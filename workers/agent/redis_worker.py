@@ -3,6 +3,7 @@
 Redis Queue Worker - Processes jobs from Redis queue directly
 """
 
+import asyncio
 import logging
 import json
 import redis
@@ -61,9 +62,19 @@ def start_worker():
             logger.error(f"Worker error: {str(e)}")
             time.sleep(5)
 
+def install_event_loop_policy():
+    """Use uvloop for asyncio event loops (e.g. concurrent article fetching) when available"""
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        logger.info("uvloop not installed, using default asyncio event loop")
+
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
+    install_event_loop_policy()
     start_worker()
@@ -0,0 +1,119 @@
+import asyncio
+import io
+
+import httpx
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3 import HTTPResponse
+
+from agent.services import article_content_service
+from agent.services.article_content_service import ArticleContentService
+
+
+class _TrackingBody(io.BytesIO):
+    """Response body that records how many bytes were read from it"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, *args, **kwargs):
+        chunk = super().read(*args, **kwargs)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class _StaticAdapter(BaseAdapter):
+    """Transport adapter that answers every request with one canned response"""
+
+    def __init__(self, headers: dict, body: bytes, status: int = 200):
+        super().__init__()
+        self.status = status
+        self.headers = headers
+        self.body = _TrackingBody(body)
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = self.status
+        response.reason = "OK" if self.status < 400 else "Error"
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.raw = HTTPResponse(
+            body=self.body, headers=self.headers, status=self.status, preload_content=False, request_url=request.url
+        )
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARTICLE_CACHE_PATH", str(tmp_path / "article_cache"))
+    monkeypatch.setattr(article_content_service, "_bad_hosts", article_content_service.TTLCache(maxsize=16, ttl=60))
+    service = ArticleContentService()
+    service.max_bytes = 1024
+    return service
+
+
+def _mount(service, headers: dict, body: bytes, status: int = 200) -> _StaticAdapter:
+    adapter = _StaticAdapter(headers, body, status)
+    service.session.mount("https://", adapter)
+    return adapter
+
+
+def test_oversized_non_html_response_is_neither_downloaded_nor_cached(service):
+    url = "https://example.com/report.pdf"
+    adapter = _mount(service, {"Content-Type": "application/pdf", "Content-Length": "50000"}, b"%PDF" + b"0" * 49996)
+
+    assert service.fetch_article_content(url) is None
+    assert adapter.body.bytes_read == 0
+    assert not service.session.cache.contains(url=url)
+
+
+def test_oversized_html_without_length_stops_at_limit_and_is_not_cached(service):
+    url = "https://example.com/huge"
+    adapter = _mount(service, {"Content-Type": "text/html"}, b"<p>" + b"x" * 500_000)
+
+    assert service.fetch_article_content(url) is None
+    assert adapter.body.bytes_read < 500_000
+    assert not service.session.cache.contains(url=url)
+
+
+def test_small_html_response_is_cached(service):
+    url = "https://example.com/article"
+    body = b"<html><body><article><p>" + b"Readable sentence. " * 40 + b"</p></article></body></html>"
+    _mount(service, {"Content-Type": "text/html", "Content-Length": str(len(body))}, body)
+    service.max_bytes = 10_000
+
+    assert service.fetch_article_content(url)
+    assert service.session.cache.contains(url=url)
+
+
+@pytest.mark.parametrize("status, blacklisted", [(404, False), (410, False), (503, True)])
+def test_only_server_errors_count_against_a_host(service, status, blacklisted):
+    _mount(service, {"Content-Type": "text/html"}, b"error", status=status)
+
+    for i in range(article_content_service.BAD_HOST_FAILURE_THRESHOLD):
+        assert service.fetch_article_content(f"https://news.example.com/story-{i}") is None
+
+    assert article_content_service._is_bad_host("news.example.com") is blacklisted
+
+
+@pytest.mark.parametrize("status, blacklisted", [(404, False), (503, True)])
+def test_only_server_errors_count_against_a_host_async(service, status, blacklisted):
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(status)))
+
+    async def download_all():
+        semaphore = asyncio.Semaphore(1)
+        for i in range(article_content_service.BAD_HOST_FAILURE_THRESHOLD):
+            assert await service._download(semaphore, f"https://news.example.com/story-{i}") is None
+        await service.aclose()
+
+    asyncio.run(download_all())
+
+    assert article_content_service._is_bad_host("news.example.com") is blacklisted
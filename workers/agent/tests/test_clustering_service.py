@@ -0,0 +1,220 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+
+from agent.services import clustering_service
+from agent.services.clustering_service import (
+    LLM_CONTEXT_SIZE,
+    ClusteringService,
+    _multi_row_insert_sql,
+    _strip_code_fence,
+)
+from agent.utils.vector_utils import batched_cosine
+
+
+@pytest.fixture
+def service():
+    # Skip __init__ so no database, embedding or Gemini clients are created
+    return ClusteringService.__new__(ClusteringService)
+
+
+@pytest.mark.parametrize("response", [
+    '{"action": "create_new"}',
+    '  ```json\n{"action": "create_new"}\n```  ',
+    '```json{"action": "create_new"}```',
+])
+def test_strip_code_fence(response):
+    assert _strip_code_fence(response).strip() == '{"action": "create_new"}'
+
+
+def test_parse_ai_decision_maps_subcategory_and_importance(service):
+    decision = service._parse_ai_decision(
+        '```json\n{"action": "create_new", "subcategory": "Markets", "importance_score": "8 (high)"}\n```',
+        []
+    )
+
+    assert decision['category'] == "Business"
+    assert decision['importance_score'] == 8
+
+
+def test_parse_ai_decision_joins_most_similar_cluster_when_id_missing(service):
+    similar = [{'cluster_id': "c-1"}, {'cluster_id': "c-2"}]
+
+    decision = service._parse_ai_decision('{"action": "join_existing", "subcategory": "Nowhere"}', similar)
+
+    assert decision['cluster_id'] == "c-1"
+    assert decision['category'] == "General"
+
+
+def test_parse_ai_decision_without_candidates_creates_new(service):
+    decision = service._parse_ai_decision('{"action": "join_existing"}', [])
+
+    assert decision['action'] == "create_new"
+    assert decision['category'] == "General" and decision['subcategory'] is None
+
+
+@pytest.mark.parametrize("response", ["not json", '["create_new"]', '{"action": "merge"}'])
+def test_parse_ai_decision_falls_back_on_bad_responses(service, response):
+    decision = service._parse_ai_decision(response, [{'cluster_id': "c-1"}])
+
+    assert decision == clustering_service._fallback_decision()
+
+
+def test_batched_cosine_scores_vectors_and_matrices():
+    mat = np.array([[1, 0], [0, 2], [1, 1], [0, 0]])
+
+    scores = batched_cosine(np.array([3, 0]), mat)
+    np.testing.assert_allclose(scores, [1, 0, 1 / np.sqrt(2), 0], rtol=1e-6)
+
+    grid = batched_cosine(np.array([[3, 0], [0, 0]]), mat)
+    assert grid.shape == (2, 4)
+    np.testing.assert_allclose(grid[0], scores, rtol=1e-6)
+    np.testing.assert_array_equal(grid[1], 0)
+
+
+def test_prune_similar_articles_keeps_short_lists(service):
+    similar = [{'title': "Anything", 'similarity': 0.9}]
+
+    assert service._prune_similar_articles({'title': "Other"}, similar) is similar
+
+
+def test_prune_similar_articles_ranks_by_title_overlap_then_similarity(service):
+    similar = [
+        {'title': "Unrelated weather report", 'similarity': 0.99},
+        {'title': "Central bank raises rates", 'similarity': 0.80},
+        {'title': None, 'similarity': 0.95},
+        {'title': "Bank raises rates again", 'similarity': 0.85},
+        {'title': "Rates news", 'similarity': 0.90},
+    ]
+
+    pruned = service._prune_similar_articles({'title': "Central Bank raises rates"}, similar)
+
+    assert len(pruned) == LLM_CONTEXT_SIZE
+    assert [article['title'] for article in pruned] == [
+        "Central bank raises rates", "Bank raises rates again", "Rates news"
+    ]
+
+
+def test_multi_row_insert_sql_suffixes_bind_names_and_is_cached():
+    statement = _multi_row_insert_sql("INSERT INTO t (a, b) VALUES ", "(:a, :b)", 3)
+
+    assert str(statement) == "INSERT INTO t (a, b) VALUES (:a_0, :b_0), (:a_1, :b_1), (:a_2, :b_2)"
+    assert _multi_row_insert_sql("INSERT INTO t (a, b) VALUES ", "(:a, :b)", 3) is statement
+
+
+def test_multi_row_insert_params_line_up_with_statement():
+    statement, params = clustering_service._multi_row_insert(
+        "INSERT INTO t (a, b) VALUES ", "(:a, :b)", [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
+    )
+
+    assert set(statement.compile().params) == set(params)
+    assert params == {'a_0': 1, 'b_0': 2, 'a_1': 3, 'b_1': 4}
+
+
+def test_vector_adapter_registers_connections_already_in_pool(monkeypatch, tmp_path):
+    registered = []
+    monkeypatch.setattr(clustering_service, "register_vector", registered.append)
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}", poolclass=QueuePool)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert engine.pool.checkedin() == 1
+
+    clustering_service._register_vector_adapter(engine)
+    clustering_service._register_vector_adapter(engine)
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    assert len(registered) == 1
+
+
+def test_check_join_target_keeps_candidate_clusters(service):
+    decision = {'action': 'join_existing', 'cluster_id': "c-2"}
+
+    assert service._check_join_target(decision, [{'cluster_id': "c-1"}, {'cluster_id': "c-2"}])['cluster_id'] == "c-2"
+
+
+def test_check_join_target_redirects_unknown_clusters(service):
+    similar = [{'cluster_id': "c-1"}]
+
+    redirected = service._check_join_target({'action': 'join_existing', 'cluster_id': "example"}, similar)
+    assert redirected['cluster_id'] == "c-1"
+
+    created = service._check_join_target({'action': 'join_existing', 'cluster_id': "example"}, [])
+    assert created['action'] == "create_new" and created['cluster_id'] is None
+
+
+class _FakeSession:
+    """Records executed statements; fail_on makes the nth execute (1-based) raise"""
+
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.executed = []
+        self.commits = 0
+
+    def execute(self, statement, params=None):
+        self.executed.append(params)
+        if len(self.executed) in self.fail_on:
+            raise OperationalError("INSERT", params, Exception("server closed the connection"))
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def batch_service(service, monkeypatch):
+    def install(embeddings, responses, db=None):
+        service.db = db or _FakeSession()
+        service.similarity_threshold = 0.85
+        service.auto_join_threshold = 0.97
+        service.auto_join_sample_rate = 0.0
+        service.llm_concurrency = 4
+        service.embedding_service = SimpleNamespace(generate_embeddings=lambda texts: np.array(embeddings))
+        service.llm_service = SimpleNamespace(generate_text_many=lambda prompts, concurrency: responses[:len(prompts)])
+        monkeypatch.setattr(service, "_find_existing_hashes", lambda hashes, urls: set())
+        monkeypatch.setattr(service, "_find_similar_articles_batch", lambda embeddings: [[] for _ in embeddings])
+        monkeypatch.setattr(service, "_remember_urls", lambda urls: None)
+        monkeypatch.setattr(service, "_remember_hashes", lambda hashes: None)
+        monkeypatch.setattr(service, "process_article", lambda article: pytest.fail("no per-article fallback"))
+        return service
+    return install
+
+
+def _feed_article(n):
+    return {'url': f"https://example.com/{n}", 'title': f"Story {n}", 'summary': "", 'source_name': "Feed"}
+
+
+def test_batch_articles_on_the_same_new_story_share_a_cluster(batch_service, monkeypatch):
+    join = '{"action": "join_existing", "subcategory": "Markets"}'
+    service = batch_service([[1.0, 0.0], [0.99, 0.05], [0.0, 1.0]], [join, join, join])
+    inserted = {}
+    monkeypatch.setattr(service, "_create_new_clusters_bulk", lambda rows: inserted.setdefault('clusters', rows))
+    monkeypatch.setattr(service, "_save_articles_bulk", lambda rows: inserted.setdefault('articles', rows))
+
+    service.process_articles_batch([_feed_article(n) for n in range(3)])
+
+    # The first and third have no candidates and create clusters; the second joins the first's
+    first, second, third = (row['cluster_id'] for row in inserted['articles'])
+    assert [row['cluster_id'] for row in inserted['clusters']] == [first, third]
+    assert second == first
+
+
+def test_batch_insert_failure_keeps_committed_rows_without_rerunning_stages(batch_service, monkeypatch):
+    create = '{"action": "create_new", "subcategory": "Markets"}'
+    # Bulk insert fails, then the individual inserts fail on the second article's cluster row
+    db = _FakeSession(fail_on={1, 4})
+    service = batch_service([[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]], [create] * 3, db)
+
+    results = service.process_articles_batch([_feed_article(n) for n in range(3)])
+
+    assert results[0] is not None
+    assert results[1:] == [None, None]
+    assert db.commits == 1
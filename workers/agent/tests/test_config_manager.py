@@ -0,0 +1,16 @@
+from agent.config_manager import WorkerConfig, get_worker_config
+
+
+def test_every_config_key_is_a_declared_attribute():
+    declared = set(WorkerConfig.__annotations__) - {"_KEY_TABLE"}
+
+    assert set(WorkerConfig._KEY_TABLE) == declared
+
+
+def test_config_attributes_are_resolved():
+    config = get_worker_config()
+
+    for name in WorkerConfig._KEY_TABLE:
+        assert hasattr(config, name)
+    assert isinstance(config.article_max_bytes, int)
+    assert isinstance(config.llm_min_summarize_chars, int)
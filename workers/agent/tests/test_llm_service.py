@@ -0,0 +1,99 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agent.services import llm_service
+from agent.services.llm_service import LLMService, _ScriptSource
+
+
+def _service_with(generate_text):
+    # Skip __init__ so no Gemini client is created; only generate_text is exercised
+    service = LLMService.__new__(LLMService)
+    service.generate_text = generate_text
+    return service
+
+
+def _echo_or_fail(prompt: str) -> str:
+    if prompt == "fail":
+        raise RuntimeError("boom")
+    return prompt.upper()
+
+
+def test_generate_text_many_keeps_order_and_maps_failures_to_none():
+    service = _service_with(_echo_or_fail)
+
+    assert service.generate_text_many(["a", "fail", "c"], max_concurrency=2) == ["A", None, "C"]
+
+
+def test_generate_text_many_empty():
+    service = _service_with(_echo_or_fail)
+
+    assert service.generate_text_many([], max_concurrency=4) == []
+
+
+def test_generate_text_many_inside_running_event_loop():
+    service = _service_with(_echo_or_fail)
+
+    async def call_from_loop():
+        # Mirrors the async /discover endpoint calling the sync clustering pipeline
+        return service.generate_text_many(["x", "y"], max_concurrency=4)
+
+    assert asyncio.run(call_from_loop()) == ["X", "Y"]
+
+
+def test_script_source_summary_falls_back_to_full_text():
+    base = {"id": "1", "title": "T", "url": "https://example.com/a", "full_text": "body"}
+    assert _ScriptSource.from_dict(base).summary == "body"
+    assert _ScriptSource.from_dict({**base, "summary": None}).summary == "body"
+    assert _ScriptSource.from_dict({**base, "summary": "rss"}).summary == "rss"
+    assert _ScriptSource.from_dict({**base, "full_text": None}).summary == ""
+
+
+def test_get_llm_service_builds_one_shared_instance(monkeypatch):
+    created = []
+
+    class _StubService:
+        def __init__(self):
+            created.append(self)
+
+        def _warmup(self):
+            pass
+
+    monkeypatch.setattr(llm_service, "_llm_service", None)
+    monkeypatch.setattr(llm_service, "LLMService", _StubService)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        services = list(executor.map(lambda _: llm_service.get_llm_service(), range(8)))
+
+    assert len(created) == 1
+    assert all(service is created[0] for service in services)
+
+
+def test_get_llm_service_failure_is_not_cached(monkeypatch):
+    monkeypatch.setattr(llm_service, "_llm_service", None)
+    monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
+
+    with pytest.raises(ValueError):
+        llm_service.get_llm_service()
+    assert llm_service._llm_service is None
+
+
+def test_generate_podcast_script_works_inside_a_running_event_loop():
+    service = LLMService.__new__(LLMService)
+    service._topic_map = {}
+    service._generate_intro = lambda user_name, topics: "intro"
+    service._generate_outro = lambda: "outro"
+    service._generate_topic_script = lambda topic_name, summaries, words: f"{topic_name} script"
+    sources = [
+        {"id": "1", "title": "A", "url": "https://example.com/a", "summary": "a", "subcategory": "Markets"},
+        {"id": "2", "title": "B", "url": "https://example.com/b", "summary": "b", "subcategory": "Elections"},
+    ]
+
+    async def generate():
+        return service.generate_podcast_script(sources, duration_minutes=2)
+
+    script = asyncio.run(generate())
+
+    assert [paragraph["text"] for paragraph in script.paragraphs] == [
+        "intro", "Markets script", "Elections script", "outro"
+    ]
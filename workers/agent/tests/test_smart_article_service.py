@@ -0,0 +1,196 @@
+import threading
+from contextlib import contextmanager
+
+import psycopg2
+import pytest
+
+from agent.services import smart_article_service
+from agent.services.smart_article_service import SmartArticleService
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        if not self.conn.alive:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+
+class _FakeConnection:
+    def __init__(self, alive=True, closed=0):
+        self.alive = alive
+        self.closed = closed
+
+    def cursor(self, *args, **kwargs):
+        return _FakeCursor(self)
+
+    def rollback(self):
+        pass
+
+
+class _FakePool:
+    """Hands out queued connections first, then fresh live ones"""
+
+    def __init__(self, idle):
+        self.idle = list(idle)
+        self.returned = []
+        self.discarded = []
+
+    def getconn(self):
+        return self.idle.pop(0) if self.idle else _FakeConnection()
+
+    def putconn(self, conn, close=False):
+        (self.discarded if close else self.returned).append(conn)
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    def install(idle):
+        pool = _FakePool(idle)
+        monkeypatch.setattr(smart_article_service, "_get_connection_pool", lambda: pool)
+        return pool
+    return install
+
+
+def test_conn_replaces_stale_connections(fake_pool):
+    dropped, closed = _FakeConnection(alive=False), _FakeConnection(closed=1)
+    pool = fake_pool([dropped, closed])
+
+    with SmartArticleService()._conn() as conn:
+        assert conn.alive and not conn.closed
+
+    assert pool.discarded == [dropped, closed]
+    assert pool.returned == [conn]
+
+
+def test_conn_returns_connection_when_body_raises(fake_pool):
+    live = _FakeConnection()
+    pool = fake_pool([live])
+
+    with pytest.raises(ValueError):
+        with SmartArticleService()._conn():
+            raise ValueError("query failed")
+
+    assert pool.returned == [live]
+
+
+def test_conn_waits_for_a_slot_instead_of_exhausting_the_pool(fake_pool, monkeypatch):
+    monkeypatch.setattr(smart_article_service, "_connection_slots", threading.BoundedSemaphore(1))
+    fake_pool([])
+    service = SmartArticleService()
+    entered = threading.Event()
+
+    def second_caller():
+        with service._conn():
+            entered.set()
+
+    with service._conn():
+        worker = threading.Thread(target=second_caller)
+        worker.start()
+        assert not entered.wait(0.2)
+
+    worker.join(timeout=2)
+    assert entered.is_set()
+
+
+class _FakeNamedCursor:
+    """Server-side cursor stand-in that streams the given ranking rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.itersize = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.params = params
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class _RowsConnection:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self, *args, **kwargs):
+        return _FakeNamedCursor(self.rows)
+
+
+def _candidate_row(article_id, subcategory, combined_score, importance_score=50, tags=()):
+    # Ranking-query column order: article_id, cluster_id, title, subcategory, tags_lower,
+    # importance_score, article_count, combined_score
+    return (article_id, f"cluster-{article_id}", f"Title {article_id}", subcategory,
+            list(tags), importance_score, 1, combined_score)
+
+
+@pytest.fixture
+def service_with_rows(monkeypatch):
+    def install(rows):
+        service = SmartArticleService()
+        monkeypatch.setattr(service, "_conn", contextmanager(lambda: iter([_RowsConnection(rows)])))
+        by_id = {row[0]: row for row in rows}
+        monkeypatch.setattr(service, "_hydrate_articles", lambda ids: {
+            article_id: {
+                'article_id': article_id,
+                'subcategory': by_id[article_id][3],
+                'importance_score': by_id[article_id][5],
+            }
+            for article_id in ids
+        })
+        return service
+    return install
+
+
+def test_selection_phases_pick_tags_world_news_diversity_then_best_remaining(service_with_rows):
+    service = service_with_rows([
+        _candidate_row("europe-1", "Europe", 90, importance_score=60),
+        _candidate_row("asia-1", "Asia", 80),
+        _candidate_row("europe-2", "Europe", 70),
+        _candidate_row("asia-2", "Asia", 65, importance_score=40),
+        _candidate_row("markets-ai", "Markets", 95, importance_score=70, tags=("ai",)),
+        _candidate_row("markets-1", "Markets", 60, importance_score=40),
+        _candidate_row("elections-1", "Elections", 20, importance_score=40),
+        _candidate_row("startups-ai", "Startups & Entrepreneurship", 50, importance_score=40, tags=("ai",)),
+    ])
+
+    articles = service.get_articles_by_subcategories(
+        ["Europe", "Asia", "Markets", "Elections"], total_articles=6, custom_tags=["AI"]
+    )
+
+    # Phase 1: best "ai" tag match, then the top two World News regions' stories
+    # Phase 2a: Markets' best unselected story (its tag pick is taken) and Elections' only story
+    # Phase 2b: the single remaining slot goes to the best leftover overall
+    # Final order is by importance score, stable within ties
+    assert [a['article_id'] for a in articles] == [
+        "markets-ai", "europe-1", "asia-1", "europe-2", "markets-1", "elections-1"
+    ]
+
+
+def test_selection_skips_tags_whose_matches_are_already_selected(service_with_rows):
+    service = service_with_rows([
+        _candidate_row("markets-ai", "Markets", 95, tags=("ai",)),
+        _candidate_row("markets-1", "Markets", 60),
+    ])
+
+    articles = service.get_articles_by_subcategories(["Markets"], total_articles=1, custom_tags=["ai", "AI"])
+
+    assert [a['article_id'] for a in articles] == ["markets-ai", "markets-1"]
+
+
+def test_selection_without_subcategories_or_tags_skips_the_query(monkeypatch):
+    service = SmartArticleService()
+    monkeypatch.setattr(service, "_conn", lambda: pytest.fail("query should not run"))
+
+    assert service.get_articles_by_subcategories([]) == []
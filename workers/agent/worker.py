@@ -10,7 +10,7 @@ import os
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from redis_worker import start_worker
+from redis_worker import install_event_loop_policy, start_worker
 
 # Configure logging
 logging.basicConfig(
@@ -20,4 +20,5 @@ logging.basicConfig(
 
 if __name__ == "__main__":
     print("Starting YourCast worker...")
+    install_event_loop_policy()
     start_worker()